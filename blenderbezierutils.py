@@ -9,19 +9,20 @@
 # License: GPL (https://github.com/Shriinivas/blenderbezierutils/blob/master/LICENSE)
 #
 
-import os, bpy, bmesh, bgl, blf, gpu
+import os, bpy, bmesh, blf, gpu
 from bpy.props import BoolProperty, IntProperty, EnumProperty, \
 FloatProperty, StringProperty, CollectionProperty, FloatVectorProperty, PointerProperty
 from bpy.types import Panel, Operator, WorkSpaceTool, AddonPreferences, Menu
 from mathutils import Vector, Matrix, geometry, kdtree
 from math import e, pi, log, sin, cos, tan, radians, degrees, sqrt, asin, acos, atan, floor, \
-ceil, pow, exp
+ceil, pow, exp, copysign
 from bpy_extras.view3d_utils import region_2d_to_vector_3d, region_2d_to_location_3d, \
 region_2d_to_origin_3d
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from bpy_extras.object_utils import world_to_camera_view
 from gpu_extras.batch import batch_for_shader
 import random, time, math
+import numpy as np
 from bpy.app.handlers import persistent
 from xml.dom import minidom
 from shutil import copyfile
@@ -37,6 +38,18 @@ bl_info = {
     "blender": (2, 80, 0),
 }
 
+
+# gpu.state replaces the deprecated bgl bindings from Blender 2.93 onwards;
+# import bgl lazily only on older versions so newer Blenders never pay its
+# load cost (and keep working once bgl is removed)
+if(hasattr(gpu, 'state')):
+    def setLineWidth(width): gpu.state.line_width_set(width)
+    def setPointSize(size): gpu.state.point_size_set(size)
+else:
+    import bgl
+    def setLineWidth(width): bgl.glLineWidth(width)
+    def setPointSize(size): bgl.glPointSize(size)
+
 DEF_ERR_MARGIN = 0.0001
 
 # Markers for invalid data
@@ -74,6 +87,57 @@ def safeRemoveObj(obj):
     except:
         pass
 
+# Handle type enum values in DNA order, for buffer based bulk access
+HDL_TYPE_MAP = ['FREE', 'AUTO', 'VECTOR', 'ALIGNED']
+HDL_TYPE_IDS = {t: i for i, t in enumerate(HDL_TYPE_MAP)}
+
+# Bulk accessors for bezier point data via foreach_get / foreach_set
+# (np.single buffers match Blender's internal single precision data)
+def getBptVecBuf(bpts, attr):
+    buf = np.empty(3 * len(bpts), dtype = np.single)
+    bpts.foreach_get(attr, buf)
+    return buf.reshape((-1, 3))
+
+def setBptVecBuf(bpts, attr, buf):
+    bpts.foreach_set(attr, np.ascontiguousarray(buf, dtype = np.single).ravel())
+
+def getBptFloatBuf(bpts, attr):
+    buf = np.empty(len(bpts), dtype = np.single)
+    bpts.foreach_get(attr, buf)
+    return buf
+
+def setBptFloatBuf(bpts, attr, buf):
+    bpts.foreach_set(attr, np.ascontiguousarray(buf, dtype = np.single))
+
+def getBptEnumBuf(bpts, attr):
+    buf = np.empty(len(bpts), dtype = np.intc)
+    try:
+        bpts.foreach_get(attr, buf)
+    except Exception as e:
+        for i, pt in enumerate(bpts):
+            buf[i] = HDL_TYPE_IDS[getattr(pt, attr)]
+    return buf
+
+def setBptEnumBuf(bpts, attr, buf):
+    try:
+        bpts.foreach_set(attr, np.ascontiguousarray(buf, dtype = np.intc))
+    except Exception as e:
+        for i, pt in enumerate(bpts):
+            setattr(pt, attr, HDL_TYPE_MAP[buf[i]])
+
+def getBptBoolBuf(bpts, attr):
+    buf = np.empty(len(bpts), dtype = np.bool_)
+    bpts.foreach_get(attr, buf)
+    return buf
+
+def setBptBoolBuf(bpts, attr, buf):
+    bpts.foreach_set(attr, np.ascontiguousarray(buf, dtype = np.bool_))
+
+# Single (N, 3) matmul in place of per-point Matrix @ Vector products
+def transformNpPts(pts, mat):
+    m = np.asarray(mat, dtype = np.single)
+    return pts @ m[:3, :3].T + m[:3, 3]
+
 #TODO combine with copyObjAttr
 def copyBezierPt(src, target, freeHandles = None, srcMw = Matrix(), invDestMW = Matrix()):
     target.handle_left_type = 'FREE'
@@ -88,6 +152,84 @@ def copyBezierPt(src, target, freeHandles = None, srcMw = Matrix(), invDestMW =
     if(freeHandles == None or freeHandles[1] == False):
         target.handle_right_type =  src.handle_right_type
 
+# Vectorized copy of all points of srcSpline into dstSpline (which must already
+# have the right number of points); single matmul instead of per-point transforms
+def copyBezierPts(srcSpline, dstSpline, srcMw = Matrix(), invDestMW = Matrix(), \
+    excludePtIdxs = {}, reverse = False):
+    srcBpts = srcSpline.bezier_points
+    dstBpts = dstSpline.bezier_points
+
+    co = getBptVecBuf(srcBpts, 'co')
+    hl = getBptVecBuf(srcBpts, 'handle_left')
+    hr = getBptVecBuf(srcBpts, 'handle_right')
+    hlt = getBptEnumBuf(srcBpts, 'handle_left_type')
+    hrt = getBptEnumBuf(srcBpts, 'handle_right_type')
+    radius = getBptFloatBuf(srcBpts, 'radius')
+    tilt = getBptFloatBuf(srcBpts, 'tilt')
+    wsb = getBptFloatBuf(srcBpts, 'weight_softbody')
+
+    if(len(excludePtIdxs) > 0):
+        keepIdxs = np.array([i for i in range(len(srcBpts)) \
+            if i not in excludePtIdxs])
+        co, hl, hr, hlt, hrt, radius, tilt, wsb = \
+            [buf[keepIdxs] for buf in (co, hl, hr, hlt, hrt, radius, tilt, wsb)]
+
+    if(reverse):
+        co, hl, hr, hlt, hrt, radius, tilt, wsb = co[::-1], hr[::-1], hl[::-1], \
+            hrt[::-1], hlt[::-1], radius[::-1], tilt[::-1], wsb[::-1]
+
+    tm = invDestMW @ srcMw
+    if(tm != Matrix()):
+        co = transformNpPts(co, tm)
+        hl = transformNpPts(hl, tm)
+        hr = transformNpPts(hr, tm)
+
+    # 'FREE' handles during write so co / handle values aren't auto-corrected
+    freeTypes = np.zeros(len(dstBpts), dtype = np.intc)
+    setBptEnumBuf(dstBpts, 'handle_left_type', freeTypes)
+    setBptEnumBuf(dstBpts, 'handle_right_type', freeTypes)
+    setBptVecBuf(dstBpts, 'co', co)
+    setBptVecBuf(dstBpts, 'handle_left', hl)
+    setBptVecBuf(dstBpts, 'handle_right', hr)
+    setBptEnumBuf(dstBpts, 'handle_left_type', hlt)
+    setBptEnumBuf(dstBpts, 'handle_right_type', hrt)
+    setBptFloatBuf(dstBpts, 'radius', radius)
+    setBptFloatBuf(dstBpts, 'tilt', tilt)
+    setBptFloatBuf(dstBpts, 'weight_softbody', wsb)
+
+# Append cnt points of srcSpline starting at srcStartIdx to the end of
+# dstSpline, transformed by invDestMW @ srcMw, through bulk buffers
+def appendBezierPts(srcSpline, dstSpline, srcStartIdx, cnt, \
+    srcMw = Matrix(), invDestMW = Matrix()):
+    srcBpts = srcSpline.bezier_points
+    dstBpts = dstSpline.bezier_points
+
+    bufInfos = [('co', getBptVecBuf, setBptVecBuf, True), \
+        ('handle_left', getBptVecBuf, setBptVecBuf, True), \
+        ('handle_right', getBptVecBuf, setBptVecBuf, True), \
+        ('radius', getBptFloatBuf, setBptFloatBuf, False), \
+        ('tilt', getBptFloatBuf, setBptFloatBuf, False), \
+        ('weight_softbody', getBptFloatBuf, setBptFloatBuf, False), \
+        ('handle_left_type', getBptEnumBuf, setBptEnumBuf, False), \
+        ('handle_right_type', getBptEnumBuf, setBptEnumBuf, False)]
+
+    tm = invDestMW @ srcMw
+    newBufs = {}
+    for attr, getter, setter, isVec in bufInfos:
+        dstBuf = getter(dstBpts, attr)
+        srcBuf = getter(srcBpts, attr)[srcStartIdx:srcStartIdx + cnt]
+        if(isVec and tm != Matrix()):
+            srcBuf = transformNpPts(srcBuf, tm)
+        newBufs[attr] = np.concatenate((dstBuf, srcBuf), axis = 0)
+
+    dstBpts.add(cnt)
+    freeTypes = np.zeros(len(dstBpts), dtype = np.intc)
+    setBptEnumBuf(dstBpts, 'handle_left_type', freeTypes)
+    setBptEnumBuf(dstBpts, 'handle_right_type', freeTypes)
+    # Handle types are last in bufInfos so position writes aren't auto-corrected
+    for attr, getter, setter, isVec in bufInfos:
+        setter(dstBpts, attr, newBufs[attr])
+
 def createSplineForSeg(curveData, bezierPts):
     spline = curveData.splines.new('BEZIER')
     spline.bezier_points.add(len(bezierPts)-1)
@@ -106,12 +248,7 @@ def createSpline(curveData, srcSpline, excludePtIdxs = {}):
     spline.bezier_points.add(len(srcSpline.bezier_points) - len(excludePtIdxs) - 1)
     spline.use_cyclic_u = srcSpline.use_cyclic_u
 
-    ptIdx = 0
-    for i in range(0, len(srcSpline.bezier_points)):
-        if(i not in excludePtIdxs):
-            copyBezierPt(srcSpline.bezier_points[i], \
-                spline.bezier_points[ptIdx], freeHandles = None)
-            ptIdx += 1
+    copyBezierPts(srcSpline, spline, excludePtIdxs = excludePtIdxs)
 
     return spline
 
@@ -154,11 +291,17 @@ def createObjFromPts(curvePts, dimensions = '3D', collection = None, \
     if(closed): spline.use_cyclic_u = True
 
     spline.bezier_points.add(len(curvePts) - 1)
+    bpts = spline.bezier_points
+
+    # Bulk-write the coords; the type classification below only reads them
+    setBptVecBuf(bpts, 'co', np.array([pt[1] for pt in curvePts], \
+        dtype = np.single))
+    setBptVecBuf(bpts, 'handle_right', np.array([pt[2] for pt in curvePts], \
+        dtype = np.single))
+
     prevPt = None
     for i, pt in enumerate(curvePts):
-        currPt = spline.bezier_points[i]
-        currPt.co = pt[1]
-        currPt.handle_right = pt[2]
+        currPt = bpts[i]
         if(not calcHdlTypes and len(pt) > 3):
             currPt.handle_right_type = pt[3]
             currPt.handle_left_type = pt[4]
@@ -181,7 +324,6 @@ def createObjFromPts(curvePts, dimensions = '3D', collection = None, \
                 currPt.handle_right_type = 'ALIGNED'
         prevPt = currPt
 
-    bpts = spline.bezier_points
     if(spline.use_cyclic_u and vectCmpWithMargin(bpts[-1].handle_right, bpts[-1].co) \
         and vectCmpWithMargin(bpts[0].handle_left, bpts[0].co)):
             if(bpts[-1].handle_left_type != 'VECTOR'):
@@ -201,6 +343,8 @@ def removeShapeKeys(obj):
     for sk in keyblocks:
         obj.shape_key_remove(sk)
 
+# Each shape key stored as three contiguous (N, 3) np.single arrays
+# ([handle_left, co, handle_right]) filled via foreach_get
 def getShapeKeyInfo(obj):
     keyData = []
     keyNames = []
@@ -208,8 +352,13 @@ def getShapeKeyInfo(obj):
     if(obj.data.shape_keys != None):
         keyblocks = obj.data.shape_keys.key_blocks
         for key in keyblocks:
-            keyData.append([[d.handle_left.copy(), d.co.copy(), d.handle_right.copy()] \
-                for d in key.data])
+            ptCnt = len(key.data)
+            bufs = []
+            for attr in ('handle_left', 'co', 'handle_right'):
+                buf = np.empty(3 * ptCnt, dtype = np.single)
+                key.data.foreach_get(attr, buf)
+                bufs.append(buf.reshape((ptCnt, 3)))
+            keyData.append(bufs)
             keyNames.append(key.name)
 
     return keyNames, keyData
@@ -220,27 +369,46 @@ def updateShapeKeyData(obj, keyData, keyNames, startIdx, cnt = None, add = False
 
     currIdx = obj.active_shape_key_index
     if(not add): removeShapeKeys(obj)
-    if(cnt == None): cnt = len(keyData[0])
+    if(cnt == None): cnt = len(keyData[0][0])
 
     for i, name in enumerate(keyNames):
         key = obj.shape_key_add(name = name)
-        for j in range(0, cnt):
-            keyIdx = j + startIdx
-            key.data[j].handle_left = keyData[i][keyIdx][0].copy()
-            key.data[j].co = keyData[i][keyIdx][1].copy()
-            key.data[j].handle_right = keyData[i][keyIdx][2].copy()
+        ptCnt = len(keyData[i][0])
+        # Negative startIdx wraps around, as with list indexing earlier
+        idxs = (startIdx + np.arange(cnt)) % ptCnt
+        for j, attr in enumerate(('handle_left', 'co', 'handle_right')):
+            key.data.foreach_set(attr, \
+                np.ascontiguousarray(keyData[i][j][idxs]).ravel())
 
     obj.active_shape_key_index = currIdx
 
+# Copyable attribute names resolved once per rna type; bezier points seeded
+# up front so their hot path never pays for a dir() scan
+COPY_ATTR_MAP = {'BezierSplinePoint': ['radius', 'tilt', 'weight_softbody']}
+COPY_ATTR_EXCL = {'co', 'handle_left', 'handle_right', \
+    'handle_left_type', 'handle_right_type'}
+
 #TODO: Fix this hack if possible
 def copyObjAttr(src, dest, invDestMW = Matrix(), mw = Matrix()):
-    for att in dir(src):
-        try:
-            if(att not in ['co', 'handle_left', 'handle_right', \
-                'handle_left_type', 'handle_right_type']):
+    key = src.bl_rna.identifier if(hasattr(src, 'bl_rna')) else type(src).__name__
+    attrs = COPY_ATTR_MAP.get(key)
+    if(attrs == None):
+        # First encounter of this type: discover the writable attributes
+        attrs = []
+        for att in dir(src):
+            try:
+                if(att not in COPY_ATTR_EXCL):
+                    setattr(dest, att, getattr(src, att))
+                    attrs.append(att)
+            except Exception as e:
+                pass
+        COPY_ATTR_MAP[key] = attrs
+    else:
+        for att in attrs:
+            try:
                 setattr(dest, att, getattr(src, att))
-        except Exception as e:
-            pass
+            except Exception as e:
+                pass
     try:
         lt = src.handle_left_type
         rt = src.handle_right_type
@@ -275,23 +443,22 @@ def addLastSeg(spline):
 
 def moveSplineStart(obj, splineIdx, idx):
     pts = obj.data.splines[splineIdx].bezier_points
-    cnt = len(pts)
-
-    ptCopy = [[p.co.copy(), p.handle_right.copy(), \
-        p.handle_left.copy(), p.handle_right_type, \
-            p.handle_left_type] for p in pts]
-
-    for i, pt in enumerate(pts):
-        srcIdx = (idx + i) % cnt
-        p = ptCopy[srcIdx]
-
-        pt.handle_left_type = 'FREE'
-        pt.handle_right_type = 'FREE'
-        pt.co = p[0]
-        pt.handle_right = p[1]
-        pt.handle_left = p[2]
-        pt.handle_right_type = p[3]
-        pt.handle_left_type = p[4]
+    if(idx == 0): return
+
+    cos = getBptVecBuf(pts, 'co')
+    hrs = getBptVecBuf(pts, 'handle_right')
+    hls = getBptVecBuf(pts, 'handle_left')
+    hrts = getBptEnumBuf(pts, 'handle_right_type')
+    hlts = getBptEnumBuf(pts, 'handle_left_type')
+
+    freeTypes = np.full(len(pts), HDL_TYPE_IDS['FREE'], dtype = np.intc)
+    setBptEnumBuf(pts, 'handle_left_type', freeTypes)
+    setBptEnumBuf(pts, 'handle_right_type', freeTypes)
+    setBptVecBuf(pts, 'co', np.roll(cos, -idx, axis = 0))
+    setBptVecBuf(pts, 'handle_right', np.roll(hrs, -idx, axis = 0))
+    setBptVecBuf(pts, 'handle_left', np.roll(hls, -idx, axis = 0))
+    setBptEnumBuf(pts, 'handle_right_type', np.roll(hrts, -idx))
+    setBptEnumBuf(pts, 'handle_left_type', np.roll(hlts, -idx))
 
 def joinCurves(curves):
     obj = curves[0]
@@ -302,9 +469,7 @@ def joinCurves(curves):
             newSpline = obj.data.splines.new('BEZIER')
             copyObjAttr(spline, newSpline)
             newSpline.bezier_points.add(len(spline.bezier_points)-1)
-            for i, pt in enumerate(spline.bezier_points):
-                copyObjAttr(pt, newSpline.bezier_points[i], \
-                    invDestMW = invMW, mw = mw)
+            copyBezierPts(spline, newSpline, srcMw = mw, invDestMW = invMW)
         safeRemoveObj(curve)
     return obj
 
@@ -425,22 +590,47 @@ def copyProperties(srcObj, destCurve):
 
         destCurve.active_material_index = activeIdx
 
+# In-place reversal of a spline's points: flip the buffer rows and swap the
+# left / right handle data (a pure index permutation, no data-block copies)
+def reverseSplinePts(spline):
+    bpts = spline.bezier_points
+    co = getBptVecBuf(bpts, 'co')
+    hl = getBptVecBuf(bpts, 'handle_left')
+    hr = getBptVecBuf(bpts, 'handle_right')
+    hlt = getBptEnumBuf(bpts, 'handle_left_type')
+    hrt = getBptEnumBuf(bpts, 'handle_right_type')
+    radius = getBptFloatBuf(bpts, 'radius')
+    tilt = getBptFloatBuf(bpts, 'tilt')
+    wsb = getBptFloatBuf(bpts, 'weight_softbody')
+
+    freeTypes = np.zeros(len(bpts), dtype = np.intc)
+    setBptEnumBuf(bpts, 'handle_left_type', freeTypes)
+    setBptEnumBuf(bpts, 'handle_right_type', freeTypes)
+    setBptVecBuf(bpts, 'co', co[::-1])
+    setBptVecBuf(bpts, 'handle_left', hr[::-1])
+    setBptVecBuf(bpts, 'handle_right', hl[::-1])
+    setBptEnumBuf(bpts, 'handle_left_type', hrt[::-1])
+    setBptEnumBuf(bpts, 'handle_right_type', hlt[::-1])
+    setBptFloatBuf(bpts, 'radius', radius[::-1])
+    setBptFloatBuf(bpts, 'tilt', tilt[::-1])
+    setBptFloatBuf(bpts, 'weight_softbody', wsb[::-1])
+
 def reverseCurve(curve):
+    splines = curve.data.splines
+    # Single spline (the common case): reverse in place, no curve data copy
+    if(len(splines) == 1):
+        reverseSplinePts(splines[0])
+        return
+
+    # Multiple splines also need their order reversed, which the splines
+    # collection doesn't support in place, so rebuild from a copy
     cp = curve.data.copy()
-    curve.data.splines.clear()
+    splines.clear()
     for s in reversed(cp.splines):
         ns = curve.data.splines.new('BEZIER')
         copyObjAttr(s, ns)
         ns.bezier_points.add(len(s.bezier_points) - 1)
-        for i, p in enumerate(reversed(s.bezier_points)):
-            copyObjAttr(p, ns.bezier_points[i])
-            ns.bezier_points[i].handle_left_type = 'FREE'
-            ns.bezier_points[i].handle_right_type = 'FREE'
-            ns.bezier_points[i].handle_left = p.handle_right
-            ns.bezier_points[i].handle_right = p.handle_left
-
-            ns.bezier_points[i].handle_left_type = p.handle_right_type
-            ns.bezier_points[i].handle_right_type = p.handle_left_type
+        copyBezierPts(s, ns, reverse = True)
     bpy.data.curves.remove(cp)
 
 # Insert spline at location insertIdx, duplicated from existing spline at
@@ -468,8 +658,16 @@ def removeBezierPts(obj, splineIdx, removePtIdxs):
             safeRemoveObj(obj)
         return
 
-    insertSpline(obj, splineIdx, splineIdx, removePtIdxs)
-    obj.data.splines.remove(obj.data.splines[splineIdx + 1])
+    # Append the replacement, drop the old spline without copying it along
+    # (insertSpline would copy all its points just to remove them right after),
+    # then rotate only the tail splines behind the replacement to keep order
+    splineCnt = len(obj.data.splines)
+    createSpline(obj.data, oldSpline, removePtIdxs)
+    obj.data.splines.remove(oldSpline)
+    for i in range(splineCnt - 1 - splineIdx):
+        spline = obj.data.splines[splineIdx]
+        createSpline(obj.data, spline)
+        obj.data.splines.remove(spline)
 
 # Returns a tuple with first value indicating change in spline index (-1, 0, 1)
 # and second indicating shift in seg index (negative) due to removal
@@ -538,43 +736,62 @@ def insertBezierPts(obj, splineIdx, startIdx, cos, handleType, margin = DEF_ERR_
     ptCnt = len(bpts)
     addCnt = len(cos)
 
-    bpts.add(addCnt)
     nextIdx = startIdx + 1
 
-    for i in range(0, (ptCnt - nextIdx)):
-        idx = ptCnt - i - 1# reversed
-        offsetIdx = idx + addCnt
-        copyObjAttr(bpts[idx], bpts[offsetIdx])
+    # Bulk-shift points after insertion location to the end via buffers
+    # (placeholder rows at nextIdx get overwritten by the loop below)
+    bufInfos = [('co', getBptVecBuf, setBptVecBuf), \
+        ('handle_left', getBptVecBuf, setBptVecBuf), \
+        ('handle_right', getBptVecBuf, setBptVecBuf), \
+        ('radius', getBptFloatBuf, setBptFloatBuf), \
+        ('tilt', getBptFloatBuf, setBptFloatBuf), \
+        ('weight_softbody', getBptFloatBuf, setBptFloatBuf), \
+        ('handle_left_type', getBptEnumBuf, setBptEnumBuf), \
+        ('handle_right_type', getBptEnumBuf, setBptEnumBuf)]
+
+    bufs = {attr: getter(bpts, attr) for attr, getter, setter in bufInfos}
+    bpts.add(addCnt)
+
+    freeTypes = np.zeros(ptCnt + addCnt, dtype = np.intc)
+    setBptEnumBuf(bpts, 'handle_left_type', freeTypes)
+    setBptEnumBuf(bpts, 'handle_right_type', freeTypes)
+    # For the closing segment of a cyclic spline nextIdx == ptCnt, so the
+    # placeholder rows come from the last point and just get appended
+    phIdx = min(nextIdx, ptCnt - 1)
+    # Handle types restored last so position writes aren't auto-corrected
+    for attr, getter, setter in bufInfos:
+        buf = bufs[attr]
+        setter(bpts, attr, np.concatenate((buf[:nextIdx], \
+            np.repeat(buf[phIdx: phIdx + 1], addCnt, axis = 0), \
+                buf[nextIdx:]), axis = 0))
 
     endIdx = getAdjIdx(obj, splineIdx, nextIdx, addCnt)
     firstPt = bpts[startIdx]
     nextPt = bpts[endIdx]
 
-    prevPt = firstPt
+    seg = [firstPt.co.copy(), firstPt.handle_right.copy(), \
+        nextPt.handle_left.copy(), nextPt.co.copy()]
+
+    # All split parameters solved on the original segment, then one batched
+    # portion-matrix product yields the control pts of every sub-segment
+    # (identical to the successive de Casteljau splits done one at a time)
+    ts = np.array([getTForPt(seg, co, margin) for co in cos])
+    ctrlPts = np.einsum('kij,jd->kid', \
+        getPartialSegMats(np.concatenate(([0.], ts)), \
+            np.concatenate((ts, [1.]))), np.array(seg))
+
     for i, pt in enumerate(bpts[nextIdx:nextIdx + addCnt]):
         pt.handle_left_type = 'FREE'
         pt.handle_right_type = 'FREE'
 
-        co = cos[i]
-        seg = [prevPt.co, prevPt.handle_right, nextPt.handle_left, nextPt.co]
-        t = getTForPt(seg, co, margin)
-        ctrlPts0 = getPartialSeg(seg, 0, t)
-        ctrlPts1 = getPartialSeg(seg, t, 1)
-
-        segPt = [ctrlPts0[2], ctrlPts1[0], ctrlPts1[1]]
-
-        prevRight = ctrlPts0[1]
-        nextLeft =  ctrlPts1[2]
-
-        pt.handle_left = segPt[0]
-        pt.co = segPt[1]
-        pt.handle_right = segPt[2]
+        pt.handle_left = ctrlPts[i][2]
+        pt.co = ctrlPts[i + 1][0]
+        pt.handle_right = ctrlPts[i + 1][1]
         pt.handle_left_type = handleType
         pt.handle_right_type = handleType
-        prevPt.handle_right = prevRight
 
-        prevPt = pt
-        nextPt.handle_left = nextLeft
+    firstPt.handle_right = ctrlPts[0][1]
+    nextPt.handle_left = ctrlPts[addCnt][2]
 
     firstPt.handle_right_type = fhdl
     nextPt.handle_left_type = nhdl
@@ -592,12 +809,12 @@ def toHexStr(rgba):
 
 # Change position of bezier points according to new matrix_world
 def changeMW(obj, newMW):
-    invMW = newMW.inverted_safe()
+    # Fuse the two matrices once; points then need just one matmul per buffer
+    tm = newMW.inverted_safe() @ obj.matrix_world
     for spline in obj.data.splines:
-        for pt in spline.bezier_points:
-            pt.co = invMW @ (obj.mw @ pt.co)
-            pt.handle_left = invMW @ (obj.mw @ pt.handle_left)
-            pt.handle_right = invMW @ (obj.mw @ pt.handle_right)
+        bpts = spline.bezier_points
+        for attr in ('co', 'handle_left', 'handle_right'):
+            setBptVecBuf(bpts, attr, transformNpPts(getBptVecBuf(bpts, attr), tm))
     obj.matrix_world = newMW
 
 # Return map in the form of objName->[splineIdx, [startPt, endPt]]
@@ -620,8 +837,8 @@ def updateCurveEndPtMap(endPtMap, addObjNames = None, removeObjNames = None):
             endPtMap[objName] = []
             mw = obj.matrix_world
             for i, s in enumerate(obj.data.splines):
-                pts = [mw @ pt.co for pt in s.bezier_points]
-                endPtMap[objName].append([i, pts])
+                cos = transformNpPts(getBptVecBuf(s.bezier_points, 'co'), mw)
+                endPtMap[objName].append([i, [Vector(co) for co in cos]])
         elif(endPtMap.get(objName) != None):
             del endPtMap[objName]
 
@@ -630,14 +847,25 @@ def updateCurveEndPtMap(endPtMap, addObjNames = None, removeObjNames = None):
 #Round to logarithmic scale .1, 0, 10, 100 etc.
 #(47.538, -1) -> 47.5; (47.538, 0) -> 48.0; (47.538, 1) -> 50.0; (47.538, 2) -> 0,
 # TODO: Rework after grid subdiv is enabled (in a version later than 2.8)
+# Cache for the subdiv ** rounding factors (called per mouse-move while
+# snapping to grid, so avoid the pow in the hot path)
+ROUND_FACT_MAP = {}
+
 def roundedVect(space3d, vect, rounding, axes):
     rounding += 1
     subdiv = getGridSubdiv(space3d)
     # TODO: Separate logic for 1
     if(subdiv == 1): subdiv = 10
-    fact = ((subdiv ** rounding) / subdiv) / getUnitScale()
+    fact = ROUND_FACT_MAP.get((subdiv, rounding))
+    if(fact == None):
+        fact = (subdiv ** rounding) / subdiv
+        ROUND_FACT_MAP[(subdiv, rounding)] = fact
+    fact /= getUnitScale()
+    if(len(axes) == 3):
+        # Straight-line fast path for the all-axes case
+        return Vector((round(vect[0] / fact) * fact, \
+            round(vect[1] / fact) * fact, round(vect[2] / fact) * fact))
     retVect = vect.copy()
-    # ~ Vector([round(vect[i] / fact) * fact for i in axes])
     for i in axes: retVect[i] = round(vect[i] / fact) * fact
     return retVect
 
@@ -700,6 +928,21 @@ def getCoordFromLoc(region, rv3d, loc):
     # return a unlocatable pt if None to avoid errors
     return coord if(coord != None) else Vector((9000, 9000))
 
+# Batched getCoordFromLoc: one perspective transform for all locs
+# (incl. the unlocatable pt substitution for those behind the view)
+def getCoordsFromLocs(region, rv3d, locs):
+    pts = np.asarray(locs, dtype = np.single)
+    pm = np.array(rv3d.perspective_matrix, dtype = np.single)
+    clip = np.c_[pts, np.ones(len(pts), dtype = np.single)] @ pm.T
+    w = clip[:, 3]
+    behind = w <= 0
+    w = np.where(behind, 1, w)
+    cos2d = np.empty((len(pts), 2), dtype = np.single)
+    cos2d[:, 0] = region.width / 2 * (1 + clip[:, 0] / w)
+    cos2d[:, 1] = region.height / 2 * (1 + clip[:, 1] / w)
+    cos2d[behind] = 9000
+    return cos2d
+
 # To be called only from 3d view
 def getCurrAreaRegion(context):
     a, r = [(a, r) for a in bpy.context.screen.areas if a.type == 'VIEW_3D' \
@@ -1104,6 +1347,15 @@ def splitCurve(selObjs, split, newColl = True):
                 if(split == 'seg'):
                     ptLen -= 1
 
+                if(split == 'point'):
+                    # World space positions of the whole spline in one matmul;
+                    # per-point work below is then just subtractions
+                    mw = obj.matrix_world
+                    bpts = spline.bezier_points
+                    wsCos = transformNpPts(getBptVecBuf(bpts, 'co'), mw)
+                    wsHls = transformNpPts(getBptVecBuf(bpts, 'handle_left'), mw)
+                    wsHrs = transformNpPts(getBptVecBuf(bpts, 'handle_right'), mw)
+
                 for j in range(0, ptLen):
                     objCopy = createSkeletalCurve(obj, parentColls)
                     if(split == 'seg'):
@@ -1112,14 +1364,23 @@ def splitCurve(selObjs, split, newColl = True):
                         updateShapeKeyData(objCopy, keyData, keyNames, \
                             len(newObjs), 2)
                     else: #(split == 'point')
-                        mw = obj.matrix_world.copy()
                         newSpline = objCopy.data.splines.new('BEZIER')
-                        newPtCo = mw @ spline.bezier_points[j].co.copy()
                         newWM = Matrix()
-                        newWM.translation = newPtCo
+                        newWM.translation = Vector(wsCos[j])
                         objCopy.matrix_world = newWM
-                        copyObjAttr(spline.bezier_points[j], \
-                            newSpline.bezier_points[0], newWM.inverted_safe(), mw)
+
+                        srcPt = spline.bezier_points[j]
+                        newPt = newSpline.bezier_points[0]
+                        newPt.handle_left_type = 'FREE'
+                        newPt.handle_right_type = 'FREE'
+                        newPt.co = Vector((0, 0, 0))
+                        newPt.handle_left = Vector(wsHls[j] - wsCos[j])
+                        newPt.handle_right = Vector(wsHrs[j] - wsCos[j])
+                        newPt.handle_left_type = srcPt.handle_left_type
+                        newPt.handle_right_type = srcPt.handle_right_type
+                        newPt.radius = srcPt.radius
+                        newPt.tilt = srcPt.tilt
+                        newPt.weight_softbody = srcPt.weight_softbody
 
                         # No point having shapekeys (pun intended :)
                         removeShapeKeys(objCopy)
@@ -1153,52 +1414,66 @@ def splitCurve(selObjs, split, newColl = True):
 
     return newObjs, changeCnt
 
-def getClosestCurve(srcMW, pt, curves, minDist = 9e+99):
-    closestCurve = None
-    for i, curve in enumerate(curves):
-        mw = curve.matrix_world
-        addLastSeg(curve.data.splines[0])
-
-        start = curve.data.splines[0].bezier_points[0]
-        end = curve.data.splines[-1].bezier_points[-1]
-        dist = ((mw @ start.co) - (srcMW @ pt)).length
-        if(dist < minDist):
-            minDist = dist
-            closestCurve = curve
-        dist = ((mw @ end.co) - (srcMW @ pt)).length
-        if(dist < minDist):
-            minDist = dist
-            reverseCurve(curve)
-            closestCurve = curve
-    return closestCurve, minDist
+# Nearest entry in kd whose curve is still unused; dead hits are skipped by
+# widening find_n instead of removing entries (removal is costly on KD-trees)
+def getClosestAliveIdx(kd, pt, alive):
+    cnt = 4
+    total = 2 * len(alive)
+    while(True):
+        for co, idx, dist in kd.find_n(pt, cnt):
+            if(alive[idx // 2]):
+                return idx, dist
+        if(cnt >= total):
+            return None, LARGE_NO
+        cnt = min(2 * cnt, total)
 
 def getCurvesArrangedByDist(curves):
     idMap = {c.name:c for c in curves}
+
+    # Open up cyclic splines once so the endpoints are well defined
+    for curve in curves:
+        addLastSeg(curve.data.splines[0])
+        addLastSeg(curve.data.splines[-1])
+
+    # KD-tree over world space start / end points of all curves;
+    # entry 2i -> start of curve i, 2i+1 -> end of curve i
+    kd = kdtree.KDTree(2 * len(curves))
+    for i, curve in enumerate(curves):
+        mw = curve.matrix_world
+        kd.insert(mw @ curve.data.splines[0].bezier_points[0].co, 2 * i)
+        kd.insert(mw @ curve.data.splines[-1].bezier_points[-1].co, 2 * i + 1)
+    kd.balance()
+
+    alive = bytearray(b'\x01' * len(curves))
+    alive[0] = 0
     orderedCurves = [curves[0].name]
     nextCurve = curves[0]
-    remainingCurves = curves[1:]
+    remainingCnt = len(curves) - 1
 
     #Arrange in order
-    while(len(remainingCurves) > 0):
-        addLastSeg(nextCurve.data.splines[-1])
-
+    while(remainingCnt > 0):
         srcMW = nextCurve.matrix_world
 
         ncEnd = nextCurve.data.splines[-1].bezier_points[-1]
-        closestCurve, dist = getClosestCurve(srcMW, ncEnd.co, remainingCurves)
+        idx, dist = getClosestAliveIdx(kd, srcMW @ ncEnd.co, alive)
 
         #Check the start also for the first curve
         if(len(orderedCurves) == 1):
             ncStart = nextCurve.data.splines[0].bezier_points[0]
-            closestCurve2, dist2 = getClosestCurve(srcMW, ncStart.co, \
-                remainingCurves, dist)
-            if(closestCurve2 != None):
+            idx2, dist2 = getClosestAliveIdx(kd, srcMW @ ncStart.co, alive)
+            if(idx2 != None and dist2 < dist):
                 reverseCurve(nextCurve)
-                closestCurve = closestCurve2
+                idx = idx2
+
+        closestCurve = curves[idx // 2]
+        #Matched its end point, so reverse to make that point the start
+        if(idx % 2 == 1):
+            reverseCurve(closestCurve)
 
+        alive[idx // 2] = 0
         orderedCurves.append(closestCurve.name)
         nextCurve = closestCurve
-        remainingCurves.remove(closestCurve)
+        remainingCnt -= 1
     return [idMap[cn] for cn in orderedCurves]
 
 def joinSegs(curves, optimized, straight, srcCurve = None, margin = DEF_ERR_MARGIN):
@@ -1256,35 +1531,38 @@ def joinSegs(curves, optimized, straight, srcCurve = None, margin = DEF_ERR_MARG
             currBezierPt.handle_right_type = 'VECTOR'
             # ~ currBezierPt.handle_right = currBezierPt.co
 
-        for i in range(ptIdx, len(nextSpline.bezier_points)):
-            if((i == len(nextSpline.bezier_points) - 1) and
-                vectCmpWithMargin(mw @ nextSpline.bezier_points[i].co, \
-                    srcMW @ currSpline.bezier_points[0].co, margin)):
+        nsBpts = nextSpline.bezier_points
+        nsPtCnt = len(nsBpts)
 
-                    currSpline.bezier_points[0].handle_left_type = 'FREE'
-                    currSpline.bezier_points[0].handle_left = \
-                        invSrcMW @ (mw @ nextSpline.bezier_points[i].handle_left)
+        #Last point of nextSpline coinciding with the start closes the loop
+        closes = (nsPtCnt - 1 >= ptIdx) and \
+            vectCmpWithMargin(mw @ nsBpts[nsPtCnt - 1].co, \
+                srcMW @ currSpline.bezier_points[0].co, margin)
 
-                    currSpline.use_cyclic_u = True
-                    break
-
-            currSpline.bezier_points.add(1)
-            currBezierPt = currSpline.bezier_points[-1]
-            copyObjAttr(nextSpline.bezier_points[i], currBezierPt, invSrcMW, mw)
+        copyCnt = (nsPtCnt - 1 if closes else nsPtCnt) - ptIdx
+        if(copyCnt > 0):
+            firstNewIdx = len(currSpline.bezier_points)
+            appendBezierPts(nextSpline, currSpline, ptIdx, copyCnt, \
+                srcMw = mw, invDestMW = invSrcMW)
 
-            if(straight and i ==  0):
+            if(straight and ptIdx == 0):
+                currBezierPt = currSpline.bezier_points[firstNewIdx]
                 currBezierPt.handle_right_type = 'FREE'
                 currBezierPt.handle_left_type = 'VECTOR'
                 # ~ currBezierPt.handle_left = currBezierPt.co
 
+        if(closes):
+            currSpline.bezier_points[0].handle_left_type = 'FREE'
+            currSpline.bezier_points[0].handle_left = \
+                invSrcMW @ (mw @ nsBpts[nsPtCnt - 1].handle_left)
+            currSpline.use_cyclic_u = True
+
         #Simply add the remaining splines
         for spline in curveData.splines[1:]:
             newSpline = newCurveData.splines.new('BEZIER')
             copyObjAttr(spline, newSpline)
-            for i, pt in enumerate(spline.bezier_points):
-                if(i > 0):
-                    newSpline.bezier_points.add(1)
-                copyObjAttr(pt, newSpline.bezier_points[-1], invSrcMW, mw)
+            newSpline.bezier_points.add(len(spline.bezier_points) - 1)
+            copyBezierPts(spline, newSpline, srcMw = mw, invDestMW = invSrcMW)
 
         if(curve != srcCurve):
             safeRemoveObj(curve)
@@ -1303,30 +1581,42 @@ def removeDupliVert(curve, margin):
         currSpline = newCurveData.splines[-1]
         copyObjAttr(spline, currSpline)
 
-        if(len(spline.bezier_points) == 1):
-            copyObjAttr(spline.bezier_points[0], currSpline.bezier_points[0])
+        bpts = spline.bezier_points
+        ptCnt = len(bpts)
+        if(ptCnt == 1):
+            copyObjAttr(bpts[0], currSpline.bezier_points[0])
             continue
 
-        cmpPts = spline.bezier_points[:]
-        pt0 = cmpPts[0]
-        while(vectCmpWithMargin(cmpPts[-1].co, pt0.co, margin) and
-            len(cmpPts) > 1):
-            endPt = cmpPts.pop()
+        cos = getBptVecBuf(bpts, 'co')
+
+        # Trailing points coinciding with the start make the spline cyclic
+        trailCnt = 0
+        while(trailCnt < ptCnt - 1 and \
+            np.all(np.abs(cos[ptCnt - 1 - trailCnt] - cos[0]) < margin)):
+            trailCnt += 1
+
+        # Boolean mask keeping the last point of every run of consecutive
+        # duplicates (the same choice the old per-point loop made)
+        keepCnt = ptCnt - trailCnt
+        dup = np.all(np.abs(cos[1:keepCnt] - cos[:keepCnt - 1]) < margin, \
+            axis = 1)
+        keepMask = np.ones(keepCnt, dtype = bool)
+        keepMask[:keepCnt - 1] = ~dup
+        keepIdxs = np.nonzero(keepMask)[0]
+
+        currSpline.bezier_points.add(len(keepIdxs) - 1)
+        copyBezierPts(spline, currSpline, \
+            excludePtIdxs = set(range(ptCnt)) - set(keepIdxs.tolist()))
+
+        if(trailCnt > 0):
+            pt0 = currSpline.bezier_points[0]
             pt0.handle_left_type = 'FREE'
             pt0.handle_right_type = 'FREE'
-            pt0.handle_left = endPt.handle_left
+            pt0.handle_left = bpts[ptCnt - trailCnt].handle_left
             currSpline.use_cyclic_u = True
-            dupliFound = True
 
-        prevPt = None
-        for pt in cmpPts:
-            if(prevPt != None and vectCmpWithMargin(prevPt.co, pt.co, margin)):
-                copyObjAttr(pt, currSpline.bezier_points[-1])
-                dupliFound = True
-            else:
-                if(prevPt != None): currSpline.bezier_points.add(1)
-                copyObjAttr(pt, currSpline.bezier_points[-1])
-            prevPt = pt
+        if(trailCnt > 0 or len(keepIdxs) < keepCnt):
+            dupliFound = True
 
     if(dupliFound):
         curve.data = newCurveData
@@ -1429,9 +1719,21 @@ def convertToFace(curve, remeshRes, perSeg, fillType, optimized):
 
     return meshObj, center, normal
 
+# Scratch bmesh reused across calls so each conversion doesn't reallocate
+# the whole BMesh pool; it never escapes the helper functions using it
+SCRATCH_BM = None
+
+def getScratchBM():
+    global SCRATCH_BM
+    if(SCRATCH_BM == None):
+        SCRATCH_BM = bmesh.new()
+    else:
+        SCRATCH_BM.clear()
+    return SCRATCH_BM
+
 def convertToMesh(curve):
     mt = curve.to_mesh()#Can't be used directly
-    bm = bmesh.new()
+    bm = getScratchBM()
     bm.from_mesh(mt)
     m = bpy.data.meshes.new(curve.data.name)
     bm.to_mesh(m)
@@ -1459,20 +1761,25 @@ def applyMeshModifiers(meshObj, remeshDepth):
 
     bpy.ops.object.modifier_apply(modifier = mod.name)
 
-    bm = bmesh.new()
+    bm = getScratchBM()
     bm.from_mesh(meshObj.data)
     bm.verts.ensure_lookup_table()
-    toRemove = []
-    for i, v in enumerate(bm.verts):
-        co = Vector([round(c, 5) for c in v.co])
-        if (abs(geometry.distance_point_to_plane(co, planeVert, normal)) > DEF_ERR_MARGIN):
-            toRemove.append(v)
+
+    # One fused plane-distance evaluation over all vertices instead of a
+    # Python geometry call per vertex
+    cos = np.empty(3 * len(meshObj.data.vertices), dtype = np.single)
+    meshObj.data.vertices.foreach_get('co', cos)
+    cos = np.round(cos.reshape((-1, 3)), 5)
+    nrml = np.asarray(normal, dtype = np.single)
+    dists = np.abs((cos - np.asarray(planeVert, dtype = np.single)) @ nrml) / \
+        np.linalg.norm(nrml)
+    toRemove = [bm.verts[i] for i in np.nonzero(dists > DEF_ERR_MARGIN)[0]]
     for v in toRemove:
         bm.verts.remove(v)
     bm.to_mesh(meshObj.data)
 
 def unsubdivideObj(meshObj):
-    bm = bmesh.new()
+    bm = getScratchBM()
     bm.from_object(meshObj, bpy.context.evaluated_depsgraph_get())
     bmesh.ops.unsubdivide(bm, verts = bm.verts)
     bm.to_mesh(meshObj.data)
@@ -1862,8 +2169,7 @@ class JoinBezierSegsOp(Operator):
     bl_description = "Join selected curves (with new segments if required)"
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         straight = bpy.context.window_manager.bezierToolkitParams.straight
         optimized = bpy.context.window_manager.bezierToolkitParams.optimized
@@ -1910,12 +2216,14 @@ class SelectInCollOp(Operator):
                 for collection in collections:
                     objs = [o for o in collection.objects]
                     idx = objs.index(obj)
-                    for i, o in enumerate(objs[idx:]):
-                        if( i % (selectIntrvl + 1) == 0): o.select_set(True)
-                        else: o.select_set(False)
-                    for i, o in enumerate(reversed(objs[:idx+1])):
-                        if( i % (selectIntrvl + 1) == 0): o.select_set(True)
-                        else: o.select_set(False)
+                    # Selection mask built once: every (selectIntrvl + 1)th
+                    # object outwards from idx in both directions; objects
+                    # already in the right state skip the RNA write entirely
+                    mask = np.zeros(len(objs), dtype = bool)
+                    mask[idx::selectIntrvl + 1] = True
+                    mask[idx::-(selectIntrvl + 1)] = True
+                    for o, sel in zip(objs, mask.tolist()):
+                        if(o.select_get() != sel): o.select_set(sel)
 
         return {'FINISHED'}
 
@@ -1927,8 +2235,7 @@ class CloseStraightOp(Operator):
     bl_description = "Close all splines in selected curves with straight segmennt"
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         for curve in curves:
             for spline in curve.data.splines:
@@ -1948,8 +2255,7 @@ class CloseSplinesOp(Operator):
     bl_description = "Close all splines in selected curves"
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         for curve in curves:
             for spline in curve.data.splines:
@@ -1967,8 +2273,7 @@ class OpenSplinesOp(Operator):
     bl_description = "Open up all splines in selected curves"
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         for curve in curves:
             for spline in curve.data.splines:
@@ -1985,14 +2290,14 @@ class SetHandleTypesOp(Operator):
 
     def execute(self, context):
         ht = bpy.context.window_manager.bezierToolkitParams.handleType
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         for curve in curves:
             for spline in curve.data.splines:
-                for pt in spline.bezier_points:
-                    pt.handle_left_type = ht
-                    pt.handle_right_type = ht
+                bpts = spline.bezier_points
+                typeBuf = np.full(len(bpts), HDL_TYPE_IDS[ht], dtype = np.intc)
+                setBptEnumBuf(bpts, 'handle_left_type', typeBuf)
+                setBptEnumBuf(bpts, 'handle_right_type', typeBuf)
 
         return {'FINISHED'}
 
@@ -2004,8 +2309,7 @@ class RemoveDupliVertCurveOp(Operator):
     bl_description = "Remove duplicate vertices and mark splines as cyclic if applicable"
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
 
         for curve in curves:
             removeDupliVert(curve, \
@@ -2021,8 +2325,7 @@ class convertToMeshOp(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o)]
+        curves = [o for o in bpy.context.selected_objects if isBezier(o)]
         params = bpy.context.window_manager.bezierToolkitParams
         remeshDepth = params.remeshDepth
         unsubdivide = params.unsubdivide
@@ -2076,13 +2379,13 @@ class AlignToFaceOp(Operator):
         alignLoc = bpy.context.window_manager.bezierToolkitParams.alignToFaceLoc
         alignOrig = bpy.context.window_manager.bezierToolkitParams.alignToFaceOrig
 
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o) and o.visible_get()]
+        curves = [o for o in bpy.context.selected_objects \
+            if isBezier(o) and o.visible_get()]
 
         if(len(curves) == 0): return {'FINISHED'}
 
-        mesheObjs = [o for o in bpy.data.objects if o in bpy.context.selected_objects \
-            and  o.type == 'MESH' and o.visible_get()]
+        mesheObjs = [o for o in bpy.context.selected_objects \
+            if o.type == 'MESH' and o.visible_get()]
 
         if(len(mesheObjs) == 0): return {'FINISHED'}
 
@@ -2201,8 +2504,8 @@ class IntersectCurvesOp(Operator):
                 self.report({'WARNING'}, "Active Object Not A Curve")
                 return {'FINISHED'}
 
-        curves = [o for o in bpy.data.objects \
-            if o in bpy.context.selected_objects and isBezier(o) and o != actCurve]
+        curves = [o for o in bpy.context.selected_objects \
+            if isBezier(o) and o != actCurve]
 
         if(actCurve != None and isBezier(actCurve)):
             curves = [actCurve] + curves
@@ -2316,6 +2619,8 @@ class MarkerController:
     defPointSize = 6
     ptColor = (0, .8, .8, 1)
 
+    # SoA per curve: cyclic spline indices, marker world locs as one
+    # (n, 3) array (single bulk transform) and the sel pt indices
     def createSMMap(self, context):
         objs = context.selected_objects
         smMap = {}
@@ -2323,27 +2628,33 @@ class MarkerController:
             if(not isBezier(curve)):
                 continue
 
-            smMap[curve.name] = {}
             mw = curve.matrix_world
+            splineIdxs = []
+            cos = []
             for splineIdx, spline in enumerate(curve.data.splines):
                 if(not spline.use_cyclic_u):
                     continue
 
                 #initialize to the curr start vert co and idx
-                smMap[curve.name][splineIdx] = \
-                    [mw @ curve.data.splines[splineIdx].bezier_points[0].co, 0]
+                splineIdxs.append(splineIdx)
+                cos.append(spline.bezier_points[0].co)
+
+                setBptBoolBuf(spline.bezier_points, 'select_control_point', \
+                    np.zeros(len(spline.bezier_points), dtype = np.bool_))
 
-                for pt in spline.bezier_points:
-                    pt.select_control_point = False
+            if(len(splineIdxs) == 0):
+                continue
 
-            if(len(smMap[curve.name]) == 0):
-                del smMap[curve.name]
+            smMap[curve.name] = {'splineIdxs': splineIdxs, \
+                'locs': transformNpPts(np.array(cos, dtype = np.single), mw), \
+                'selIdxs': np.zeros(len(splineIdxs), dtype = np.intc)}
 
         return smMap
 
     def createBatch(self, context):
-        positions = [s[0] for cn in self.smMap.values() for s in cn.values()]
-        colors = [MarkerController.ptColor for i in range(0, len(positions))]
+        locs = [spMap['locs'] for spMap in self.smMap.values()]
+        positions = np.concatenate(locs) if(len(locs) > 0) else []
+        colors = [MarkerController.ptColor] * len(positions)
 
         self.batch = batch_for_shader(self.shader, \
             "POINTS", {"pos": positions, "color": colors})
@@ -2352,7 +2663,8 @@ class MarkerController:
             context.area.tag_redraw()
 
     def drawHandler(self):
-        bgl.glPointSize(MarkerController.defPointSize)
+        if(len(self.smMap) == 0): return
+        setPointSize(MarkerController.defPointSize)
         self.batch.draw(self.shader)
 
     def removeMarkers(self, context):
@@ -2385,40 +2697,51 @@ class MarkerController:
         self.createBatch(context)
 
     def saveStartVerts(self):
-        for curveName in self.smMap.keys():
-            curve = bpy.data.objects[curveName]
-            spMap = self.smMap[curveName]
+        for curveName, spMap in self.smMap.items():
+            curve = bpy.data.objects.get(curveName)
+            if(curve == None): continue
 
-            for splineIdx in spMap.keys():
-                markerInfo = spMap[splineIdx]
-                if(markerInfo[1] != 0):
-                    loc, idx = markerInfo[0], markerInfo[1]
-                    moveSplineStart(curve, splineIdx, idx)
+            for splineIdx, selIdx in zip(spMap['splineIdxs'], spMap['selIdxs']):
+                if(selIdx != 0):
+                    moveSplineStart(curve, splineIdx, int(selIdx))
 
+    # Returns True only if any marker actually moved, so the caller can
+    # skip re-batching on the (vast majority of) timer ticks without change
     def updateSMMap(self):
-        for curveName in self.smMap.keys():
-            curve = bpy.data.objects[curveName]
-            spMap = self.smMap[curveName]
+        changed = False
+        for curveName, spMap in self.smMap.items():
+            # Resolve the name-hash lookup once per curve, not per spline
+            curve = bpy.data.objects.get(curveName)
+            if(curve == None): continue
+            splines = curve.data.splines
             mw = curve.matrix_world
 
-            for splineIdx in spMap.keys():
-                markerInfo = spMap[splineIdx]
-                loc, idx = markerInfo[0], markerInfo[1]
-                pts = curve.data.splines[splineIdx].bezier_points
+            selIdxs = spMap['selIdxs']
+            oldSelIdxs = selIdxs.copy()
+            cos = np.empty((len(selIdxs), 3), dtype = np.single)
+            for i, splineIdx in enumerate(spMap['splineIdxs']):
+                pts = splines[splineIdx].bezier_points
+
+                selected = np.nonzero(getBptBoolBuf(pts, \
+                    'select_control_point'))[0]
 
-                selIdxs = [x for x in range(0, len(pts)) \
-                    if pts[x].select_control_point == True]
+                if(len(selected) > 0): selIdxs[i] = selected[0]
+                cos[i] = pts[int(selIdxs[i])].co
 
-                selIdx = selIdxs[0] if(len(selIdxs) > 0 ) else idx
-                co = mw @ pts[selIdx].co
-                self.smMap[curveName][splineIdx] = [co, selIdx]
+            locs = transformNpPts(cos, mw)
+            if(not np.array_equal(oldSelIdxs, selIdxs) or \
+                not np.allclose(locs, spMap['locs'], atol = DEF_ERR_MARGIN)):
+                spMap['locs'] = locs
+                changed = True
+        return changed
 
     def deselectAll(self):
         for curveName in self.smMap.keys():
-            curve = bpy.data.objects[curveName]
+            curve = bpy.data.objects.get(curveName)
+            if(curve == None): continue
             for spline in curve.data.splines:
-                for pt in spline.bezier_points:
-                    pt.select_control_point = False
+                setBptBoolBuf(spline.bezier_points, 'select_control_point', \
+                    np.zeros(len(spline.bezier_points), dtype = np.bool_))
 
     def getSpaces3D(context):
         areas3d  = [area for area in context.window.screen.areas \
@@ -2426,9 +2749,9 @@ class MarkerController:
 
         return [s for a in areas3d for s in a.spaces if s.type == 'VIEW_3D']
 
-    def hideHandles(context):
+    def hideHandles(context, spaces = None):
         states = []
-        spaces = MarkerController.getSpaces3D(context)
+        if(spaces == None): spaces = MarkerController.getSpaces3D(context)
         for s in spaces:
             if(hasattr(s.overlay, 'show_curve_handles')):
                 states.append(s.overlay.show_curve_handles)
@@ -2438,8 +2761,8 @@ class MarkerController:
                 s.overlay.display_handle = 'NONE'
         return states
 
-    def resetShowHandleState(context, handleStates):
-        spaces = MarkerController.getSpaces3D(context)
+    def resetShowHandleState(context, handleStates, spaces = None):
+        if(spaces == None): spaces = MarkerController.getSpaces3D(context)
         for i, s in enumerate(spaces):
             if(hasattr(s.overlay, 'show_curve_handles')):
                 s.overlay.show_curve_handles = handleStates[i]
@@ -2457,7 +2780,8 @@ class ModalMarkSegStartOp(bpy.types.Operator):
         wm = context.window_manager
         wm.event_timer_remove(self._timer)
         self.markerState.removeMarkers(context)
-        MarkerController.resetShowHandleState(context, self.handleStates)
+        MarkerController.resetShowHandleState(context, self.handleStates, \
+            self.spaces3d)
         bpy.context.window_manager.bezierToolkitParams.markVertex = False
 
     def modal (self, context, event):
@@ -2473,21 +2797,24 @@ class ModalMarkSegStartOp(bpy.types.Operator):
             return {'FINISHED'}
 
         if(event.type == 'TIMER'):
-            self.markerState.updateSMMap()
-            self.markerState.createBatch(context)
+            if(self.markerState.updateSMMap()):
+                self.markerState.createBatch(context)
 
         return {"PASS_THROUGH"}
 
     def execute(self, context):
-        #TODO: Why such small step?
-        self._timer = context.window_manager.event_timer_add(time_step = 0.0001, \
+        # 20 Hz is enough for a marker overlay; rebatching happens only
+        # when updateSMMap reports an actual change anyway
+        self._timer = context.window_manager.event_timer_add(time_step = 0.05, \
             window = context.window)
 
         context.window_manager.modal_handler_add(self)
         self.markerState = MarkerController(context)
 
         #Hide so that users don't accidentally select handles instead of points
-        self.handleStates = MarkerController.hideHandles(context)
+        # One spaces walk per modal session, shared by hide and reset
+        self.spaces3d = MarkerController.getSpaces3D(context)
+        self.handleStates = MarkerController.hideHandles(context, self.spaces3d)
 
         return {"RUNNING_MODAL"}
 
@@ -2778,7 +3105,7 @@ class BezierUtilsPanel(Panel):
     def colorCurves(scene = None, add = False, remove = False):
         def ccDrawHandler():
             if(bpy.context.window_manager.bezierToolkitParams.applyCurveColor):
-                bgl.glLineWidth(BezierUtilsPanel.lineWidth)
+                setLineWidth(BezierUtilsPanel.lineWidth)
                 if(BezierUtilsPanel.lineBatch != None):
                     BezierUtilsPanel.lineBatch.draw(BezierUtilsPanel.shader)
 
@@ -2815,12 +3142,14 @@ class BezierUtilsPanel(Panel):
             for o in objs:
                 colorVal = o.data.get('curveColor')
                 if(colorVal != None):
+                    wsData = getBptData(o, withShapeKey = True, \
+                        shapeKeyIdx = None, fromMix = True)
                     for i, spline in enumerate(o.data.splines):
                         for j in range(0, len(spline.bezier_points)):
-                            segPts = getBezierDataForSeg(o, i, j, withShapeKey = True, \
-                                shapeKeyIdx = None, fromMix = True)
-                            if(segPts == None):
+                            segEndIdx = getAdjIdx(o, i, j)
+                            if(segEndIdx == None):
                                 continue
+                            segPts = [wsData[i][j], wsData[i][segEndIdx]]
                             pts = getPtsAlongBezier2D(segPts, getAllAreaRegions(), \
                                 FTProps.dispCurveRes, maxRes = MAX_NONSEL_CURVE_RES)
                             linePts = getLinesFromPts(pts)
@@ -2851,48 +3180,54 @@ def getTangentAtT(p0, p1, p2, p3, t):
         3 * t * t * p2 + 6 * t * c * p2 + 3 * t * t * p3
     return tangent
 
-# iterative brute force, not optimized, some iterations maybe redundant
+# Closed-form solve of B(t) = co for one coordinate: convert the Bernstein
+# control values to power-basis coefficients and let np.roots do the work
+# (replaces the iterative bisection from four directions)
 def getTsForPt(p0, p1, p2, p3, co, coIdx, tolerance = 0.000001, maxItr = 1000):
-    ts = set()
-    # check t from start to end and end to start
-    for T in [1., 0.]:
-        # check clockwise as well as anticlockwise
-        for dirn in [1, -1]:
-            t = T
-            t2 = 1
-            rhs = getPtFromT(p0, p1, p2, p3, t)[coIdx]
-            error = rhs - co
-            i = 0
-
-            while(abs(error) > tolerance and i < maxItr):
-                t2 /= 2
-                if(dirn * error < 0):
-                    t += t2
-                else:
-                    t -= t2
-                rhs = getPtFromT(p0, p1, p2, p3, t)[coIdx]
-                error = rhs - co
+    a, b, c, d = float(p0[coIdx]), float(p1[coIdx]), \
+        float(p2[coIdx]), float(p3[coIdx])
+    coeffs = [-a + 3 * b - 3 * c + d, 3 * a - 6 * b + 3 * c, \
+        -3 * a + 3 * b, a - co]
+    try:
+        roots = np.roots(coeffs)
+    except Exception as e:
+        return np.empty(0)
+    ts = roots.real[np.abs(roots.imag) < tolerance]
+    ts = ts[(ts >= 0) & (ts <= 1)]
+    # Sorted dedup without the float set churn
+    return np.unique(np.round(ts, 3))
 
-                i += 1
+def getTForPt(curve, testPt, tolerance = .000001):
+    pts = np.array(curve, dtype = np.float64)
+
+    # Power basis coeffs of B(t) - testPt (per axis, 3-vectors)
+    a3 = -pts[0] + 3 * pts[1] - 3 * pts[2] + pts[3]
+    a2 = 3 * pts[0] - 6 * pts[1] + 3 * pts[2]
+    a1 = -3 * pts[0] + 3 * pts[1]
+    a0 = pts[0] - np.array(testPt, dtype = np.float64)
+
+    # d/dt of the distance square is (upto a factor) the quintic
+    # sum over axes of (B(t) - testPt) . B'(t); its real roots in (0, 1)
+    # together with the end pts are the only candidates for the closest t
+    quintic = np.zeros(6)
+    for axis in range(3):
+        # polymul trims leading zero coeffs, so align at the low order end
+        prod = np.polymul([a3[axis], a2[axis], a1[axis], a0[axis]], \
+            [3 * a3[axis], 2 * a2[axis], a1[axis]])
+        quintic[6 - len(prod):] += prod
+    try:
+        roots = np.roots(quintic)
+    except Exception as e:
+        return None
+    ts = roots.real[np.abs(roots.imag) < tolerance]
+    ts = np.concatenate((ts[(ts > 0) & (ts < 1)], [0., 1.]))
 
-            if(i < maxItr and t >= 0 and t <= 1):
-                ts.add(round(t, 3))
-    return ts
+    c = 1 - ts
+    candidates = np.outer(c * c * c, pts[0]) + np.outer(3 * c * c * ts, pts[1]) + \
+        np.outer(3 * c * ts * ts, pts[2]) + np.outer(ts * ts * ts, pts[3])
+    diffs = candidates - np.array(testPt, dtype = np.float64)
 
-#TODO: There may be a more efficient approach, but this seems foolproof
-def getTForPt(curve, testPt, tolerance = .000001):
-    minLen = LARGE_NO
-    retT = None
-    for coIdx in range(0, 3):
-        ts = getTsForPt(curve[0], curve[1], curve[2], curve[3], \
-            testPt[coIdx], coIdx, tolerance)
-        for t in ts:
-            pt = getPtFromT(curve[0], curve[1], curve[2], curve[3], t)
-            pLen = (testPt - pt).length
-            if(pLen < minLen):
-                minLen = pLen
-                retT = t
-    return retT
+    return float(ts[np.argmin(np.sum(diffs * diffs, axis = 1))])
 
 def getCosSortedByT(seg, cos, margin):
     coInfo = set()
@@ -3104,18 +3439,51 @@ def getSplineLenTmpObj(tmpSpline, spline, mw):
     if(spline.use_cyclic_u): l += getSegLenTmpObj(tmpSpline, [bpts[-1], bpts[0]], mw)
     return l
 
-def getSegLen(pts, error = DEF_ERR_MARGIN, start = None, end = None, t1 = 0, t2 = 1):
-    if(start == None): start = pts[0]
-    if(end == None): end = pts[-1]
-
-    t1_5 = (t1 + t2)/2
-    mid = getPtFromT(*pts, t1_5)
-    l = (end - start).length
-    l2 = (mid - start).length + (end - mid).length
-    if (l2 - l > error):
-        return (getSegLen(pts, error, start, mid, t1, t1_5) +
-                getSegLen(pts, error, mid, end, t1_5, t2))
-    return l2
+# (n, 4) Bernstein basis at n uniform parameters, cached per resolution;
+# sampling a seg is then just basis @ ctrlPts
+BERN_BASIS_MAP = {}
+
+def getBernBasis(n):
+    basis = BERN_BASIS_MAP.get(n)
+    if(basis is None):
+        t = np.linspace(0, 1, n)
+        c = 1 - t
+        basis = np.stack((c * c * c, 3 * c * c * t, 3 * c * t * t, t * t * t), \
+            axis = 1)
+        if(len(BERN_BASIS_MAP) > 256):
+            BERN_BASIS_MAP.clear()
+        BERN_BASIS_MAP[n] = basis
+    return basis
+
+# Chord-length of the whole segment from one vectorized Bernstein evaluation
+# at N uniform parameters, doubling N until the length converges (replaces
+# the midpoint recursion with its per-level Python Vector arithmetic);
+# works for both 2d and 3d control points
+def getSegLen(pts, error = DEF_ERR_MARGIN):
+    ctrl = np.array(pts, dtype = np.float64)
+    n = 8
+    prevLen = -1
+    while(True):
+        b = getBernBasis(n + 1) @ ctrl
+        segLen = np.linalg.norm(np.diff(b, axis = 0), axis = 1).sum()
+        if((prevLen >= 0 and (segLen - prevLen) < error) or n >= 2048):
+            return segLen
+        prevLen = segLen
+        n *= 2
+
+# Seg lengths keyed on the (rounded) ctrl pts themselves, so any edit to the
+# geometry misses naturally and no explicit invalidation hook is needed
+SEG_LEN_CACHE = {}
+MAX_SEG_LEN_CACHE_CNT = 4096
+
+def getCachedSegLen(seg):
+    key = tuple(round(c, 6) for pt in seg for c in pt)
+    slen = SEG_LEN_CACHE.get(key)
+    if(slen == None):
+        if(len(SEG_LEN_CACHE) > MAX_SEG_LEN_CACHE_CNT): SEG_LEN_CACHE.clear()
+        slen = getSegLen(seg)
+        SEG_LEN_CACHE[key] = slen
+    return slen
 
 def hasAlignedHandles(pt):
     if(len(pt) == 5 and 'ALIGNED' in {pt[3], pt[4]} and 'FREE' not in {pt[3], pt[4]}):
@@ -3143,18 +3511,40 @@ def getInterpBezierPts(segPts, subdivPerUnit, segLens = None, maxRes = None):
     if(len(segPts) < 2):
         return []
 
-    curvePts = []
+    segs = []
+    resCnts = []
     for i in range(1, len(segPts)):
         seg = [segPts[i-1][1], segPts[i-1][2], segPts[i][0], segPts[i][1]]
         if(segLens != None and len(segLens) > (i-1)):
             res = int(segLens[i-1] * subdivPerUnit)
         else:
-            res = int(getSegLen(seg) * subdivPerUnit)
+            res = int(getCachedSegLen(seg) * subdivPerUnit)
         if(res < 2): res = 2
         if(maxRes != None and res > maxRes): res = maxRes
-        curvePts += geometry.interpolate_bezier(*seg, res)
+        segs.append(seg)
+        resCnts.append(res)
 
-    return curvePts
+    # One basis @ ctrlPts matmul per segment with the cached Bernstein basis
+    # (each segment contributes res pts including both endpoints, same as
+    # geometry.interpolate_bezier)
+    cos = np.concatenate([getBernBasis(res) @ np.array(seg, dtype = np.single) \
+        for seg, res in zip(segs, resCnts)])
+
+    return [Vector(co) for co in cos]
+
+# Redraws recompute the same subdivisions as long as the ctrl pts and zoom
+# level stay put, so cache the interpolated pts keyed on both (any edit or
+# zoom past the bucket boundary naturally misses)
+INTERP_BEZIER_PT_CACHE = {}
+LINE_PT_CACHE = {}
+MAX_INTERP_CACHE_CNT = 4096
+
+def getSegPtsKey(segPts):
+    return tuple(round(c, 6) for pt in segPts for v in pt[:3] for c in v)
+
+def getViewDistBucket(viewDist):
+    if(viewDist <= 0): return 0
+    return round(log(viewDist, 2) * 4)
 
 # Used in functions where actual locs of pts on curve matter (like subdiv Bezier)
 # (... kind of expensive)
@@ -3162,18 +3552,34 @@ def getPtsAlongBezier3D(segPts, rv3d, curveRes, minRes = 200):
 
     viewDist = rv3d.view_distance
 
+    key = ('3D', getSegPtsKey(segPts), curveRes, minRes, \
+        getViewDistBucket(viewDist))
+    curvePts = INTERP_BEZIER_PT_CACHE.get(key)
+    if(curvePts != None): return curvePts
+
     # The smaller the view dist (higher zoom level),
     # the higher the num of subdivisions
     curveRes = curveRes / viewDist
 
     if(curveRes < minRes): curveRes = minRes
 
-    return getInterpBezierPts(segPts, subdivPerUnit = curveRes)
+    curvePts = getInterpBezierPts(segPts, subdivPerUnit = curveRes)
+
+    if(len(INTERP_BEZIER_PT_CACHE) > MAX_INTERP_CACHE_CNT):
+        INTERP_BEZIER_PT_CACHE.clear()
+    INTERP_BEZIER_PT_CACHE[key] = curvePts
+
+    return curvePts
 
 # Used in functions where only visual resolution of curve matters (like draw Bezier)
 # (... not so expensive)
 # TODO: Calculate maxRes dynamically
 def getPtsAlongBezier2D(segPts, areaRegionInfo, curveRes, maxRes = None):
+    key = ('2D', getSegPtsKey(segPts), curveRes, maxRes, \
+        tuple(getViewDistBucket(info[2].view_distance) for info in areaRegionInfo))
+    curvePts = INTERP_BEZIER_PT_CACHE.get(key)
+    if(curvePts != None): return curvePts
+
     segLens = []
     for i in range(1, len(segPts)):
         seg = [segPts[i-1][1], segPts[i-1][2], segPts[i][0], segPts[i][1]]
@@ -3182,89 +3588,108 @@ def getPtsAlongBezier2D(segPts, areaRegionInfo, curveRes, maxRes = None):
         segLen = 0
         for info in areaRegionInfo:
             seg2D = [getCoordFromLoc(info[1], info[2], loc) for loc in seg]
-            sl = getSegLen(seg2D)
+            sl = getCachedSegLen(seg2D)
             if(sl > segLen):
                 segLen = sl
         segLens.append(segLen)
 
-    return getInterpBezierPts(segPts, subdivPerUnit = curveRes, \
+    curvePts = getInterpBezierPts(segPts, subdivPerUnit = curveRes, \
         segLens = segLens, maxRes = maxRes)
 
+    if(len(INTERP_BEZIER_PT_CACHE) > MAX_INTERP_CACHE_CNT):
+        INTERP_BEZIER_PT_CACHE.clear()
+    INTERP_BEZIER_PT_CACHE[key] = curvePts
+
+    return curvePts
+
 def getLinesFromPts(pts):
-    positions = []
-    for i, pt in enumerate(pts):
-        positions.append(pt)
-        if(i > 0 and i < (len(pts)-1)):
-            positions.append(pt)
+    # Deterministic permutation of pts, so key on the very list (the entry
+    # keeps pts alive, ensuring its id is not reused while cached)
+    entry = LINE_PT_CACHE.get(id(pts))
+    if(entry != None and entry[0] is pts): return entry[1]
+
+    cnt = len(pts)
+    if(cnt < 2):
+        positions = pts[:]
+    else:
+        # Every interior pt doubled: one strided slice pair instead of
+        # the per-pt append loop
+        cos = np.array(pts, dtype = np.single)
+        lineCos = np.empty((2 * (cnt - 1), cos.shape[1]), dtype = np.single)
+        lineCos[0::2] = cos[:-1]
+        lineCos[1::2] = cos[1:]
+        positions = list(lineCos)
+
+    if(len(LINE_PT_CACHE) > MAX_INTERP_CACHE_CNT):
+        LINE_PT_CACHE.clear()
+    LINE_PT_CACHE[id(pts)] = (pts, positions)
+
     return positions
 
 #see https://stackoverflow.com/questions/878862/drawing-part-of-a-b%c3%a9zier-curve-by-reusing-a-basic-b%c3%a9zier-curve-function/879213#879213
+# Single-interval case of the portion-matrix form (see getPartialSegMats
+# for the batched variant); scalar entries, one 4x4 @ 4x3 product
 def getPartialSeg(seg, t0, t1):
-    pts = [seg[0], seg[1], seg[2], seg[3]]
-
     if(t0 > t1):
-        tt = t1
-        t1 = t0
-        t0 = tt
-
-    u0 = 1.0 - t0
-    u1 = 1.0 - t1
-
-    qa = [pts[0][i]*u0*u0 + pts[1][i]*2*t0*u0 + pts[2][i]*t0*t0 for i in range(0, 3)]
-    qb = [pts[0][i]*u1*u1 + pts[1][i]*2*t1*u1 + pts[2][i]*t1*t1 for i in range(0, 3)]
-    qc = [pts[1][i]*u0*u0 + pts[2][i]*2*t0*u0 + pts[3][i]*t0*t0 for i in range(0, 3)]
-    qd = [pts[1][i]*u1*u1 + pts[2][i]*2*t1*u1 + pts[3][i]*t1*t1 for i in range(0, 3)]
-
-    pta = Vector([qa[i]*u0 + qc[i]*t0 for i in range(0, 3)])
-    ptb = Vector([qa[i]*u1 + qc[i]*t1 for i in range(0, 3)])
-    ptc = Vector([qb[i]*u0 + qd[i]*t0 for i in range(0, 3)])
-    ptd = Vector([qb[i]*u1 + qd[i]*t1 for i in range(0, 3)])
-
-    return [pta, ptb, ptc, ptd]
-
+        t0, t1 = t1, t0
+
+    u0 = 1 - t0
+    u1 = 1 - t1
+    mat = np.array([ \
+        [u0 * u0 * u0, 3 * t0 * u0 * u0, 3 * t0 * t0 * u0, t0 * t0 * t0], \
+        [u0 * u0 * u1, 2 * t0 * u0 * u1 + u0 * u0 * t1, \
+            t0 * t0 * u1 + 2 * t0 * u0 * t1, t0 * t0 * t1], \
+        [u0 * u1 * u1, 2 * t1 * u1 * u0 + u1 * u1 * t0, \
+            t1 * t1 * u0 + 2 * t1 * u1 * t0, t1 * t1 * t0], \
+        [u1 * u1 * u1, 3 * t1 * u1 * u1, 3 * t1 * t1 * u1, t1 * t1 * t1]])
+    pts = mat @ np.array(seg, dtype = np.float64)
+
+    return [Vector(pt) for pt in pts]
+
+# (K, 4, 4) portion matrices for intervals [t0[k], t1[k]]; multiplying with the
+# (4, 3) control pts of a seg gives the control pts of all the sub-segs at once
+def getPartialSegMats(t0, t1):
+    u0 = 1 - t0
+    u1 = 1 - t1
+    mats = np.empty((len(t0), 4, 4))
+    mats[:, 0, 0] = u0 ** 3
+    mats[:, 0, 1] = 3 * t0 * u0 ** 2
+    mats[:, 0, 2] = 3 * t0 ** 2 * u0
+    mats[:, 0, 3] = t0 ** 3
+    mats[:, 1, 0] = u0 * u0 * u1
+    mats[:, 1, 1] = 2 * t0 * u0 * u1 + u0 * u0 * t1
+    mats[:, 1, 2] = t0 * t0 * u1 + 2 * t0 * u0 * t1
+    mats[:, 1, 3] = t0 * t0 * t1
+    mats[:, 2, 0] = u0 * u1 * u1
+    mats[:, 2, 1] = 2 * t1 * u1 * u0 + u1 * u1 * t0
+    mats[:, 2, 2] = t1 * t1 * u0 + 2 * t1 * u1 * t0
+    mats[:, 2, 3] = t1 * t1 * t0
+    mats[:, 3, 0] = u1 ** 3
+    mats[:, 3, 1] = 3 * t1 * u1 ** 2
+    mats[:, 3, 2] = 3 * t1 ** 2 * u1
+    mats[:, 3, 3] = t1 ** 3
+    return mats
+
+# Locate every equidistant target on the cumulative arc length with one
+# searchsorted and interpolate all of them in a single vectorized lerp
+# (replaces the vertex-at-a-time walk over curvePts)
 def getInterpolatedVertsCo(curvePts, numDivs):
-    # Can be calculated only once
-    curveLength = sum((curvePts[i] - curvePts[i-1]).length
-        for i in range(1, len(curvePts)))
+    pts = np.array(curvePts, dtype = np.float64)
+    chords = np.linalg.norm(np.diff(pts, axis = 0), axis = 1)
+    curveLength = chords.sum()
 
     if(floatCmpWithMargin(curveLength, 0)):
         return [curvePts[0]] * numDivs
 
-    segLen = curveLength / numDivs
-    vertCos = [curvePts[0]]
-
-    actualLen = 0
-    vertIdx = 0
-
-    for i in range(1, numDivs):
-        co = None
-        targetLen = i * segLen
-
-        while(not floatCmpWithMargin(actualLen, targetLen)
-            and actualLen < targetLen):
-
-            vertCo = curvePts[vertIdx]
-            vertIdx += 1
-            nextVertCo = curvePts[vertIdx]
-            actualLen += (nextVertCo - vertCo).length
-
-        if(floatCmpWithMargin(actualLen, targetLen)):
-            co = curvePts[vertIdx]
-
-        else:   #interpolate
-            diff = actualLen - targetLen
-            co = (nextVertCo - (nextVertCo - vertCo) * \
-                (diff/(nextVertCo - vertCo).length))
-
-            #Revert to last pt
-            vertIdx -= 1
-            actualLen -= (nextVertCo - vertCo).length
-        vertCos.append(co)
+    cumLens = np.concatenate(([0.], np.cumsum(chords)))
+    targetLens = np.linspace(0, curveLength, numDivs + 1)[1:-1]
+    idxs = np.searchsorted(cumLens, targetLens)
+    denoms = chords[idxs - 1].copy()
+    denoms[denoms == 0] = 1
+    fracs = (targetLens - cumLens[idxs - 1]) / denoms
+    cos = pts[idxs - 1] + (pts[idxs] - pts[idxs - 1]) * fracs[:, None]
 
-    # ~ if(not vectCmpWithMargin(curvePts[0], curvePts[-1])):
-    vertCos.append(curvePts[-1])
-
-    return vertCos
+    return [curvePts[0]] + [Vector(co) for co in cos] + [curvePts[-1]]
 
 #
 # The following section is a Python conversion of the javascript
@@ -3613,27 +4038,36 @@ class BGLDrawMgr:
         self.lineInfoMap = {}
         self.ptInfoMap = {}
         self.shader = shader
+        # Infos change only on events, but the draw handler fires once per
+        # region redraw; rebuild the batches lazily and replay them otherwise
+        self.rev = 0
+        self.batchRev = -1
+        self.lineBatches = [] # [size, batch] per line width
+        self.ptBatches = [] # [size, batch] per pt size
 
     def addLineInfo(self, infoId, size, color, pts, \
         gradientStart = None, gradientEnd = None, mid = True):
         self.lineInfoMap[infoId] = BGLDrawInfoLine(size, color, pts, \
             gradientStart, gradientEnd, mid)
+        self.rev += 1
 
     def addPtInfo(self, infoId, size, color, pts):
         self.ptInfoMap[infoId] = BGLDrawInfo(size, color, pts)
+        self.rev += 1
+
+    def updateBatches(self):
+        self.lineBatches = []
+        self.ptBatches = []
 
-    def redraw(self):
         lineInfos = sorted(self.lineInfoMap.values(), key = lambda x: (x.size))
         pos = []
         col = []
-        batches = []
         for i, info in enumerate(lineInfos):
             if(i == 0 or info.size != lineInfos[i-1].size):
-                if(i > 0):
-                    bgl.glLineWidth(lineInfos[i-1].size)
-                    batch = batch_for_shader(self.shader, \
-                        'LINES', {"pos": pos, "color": col})
-                    batch.draw(self.shader)
+                if(i > 0 and len(pos) > 0):
+                    self.lineBatches.append([lineInfos[i-1].size, \
+                        batch_for_shader(self.shader, \
+                            'LINES', {"pos": pos, "color": col})])
                 pos = []
                 col = []
 
@@ -3658,19 +4092,19 @@ class BGLDrawMgr:
             col += lineCols
 
         if(len(pos) > 0):
-            bgl.glLineWidth(lineInfos[-1].size)
-            batch = batch_for_shader(self.shader, \
-                'LINES', {"pos": pos, "color": col})
-            batch.draw(self.shader)
+            self.lineBatches.append([lineInfos[-1].size, \
+                batch_for_shader(self.shader, \
+                    'LINES', {"pos": pos, "color": col})])
 
         ptInfos = sorted(self.ptInfoMap.values(), key = lambda x: (x.size))
+        pos = []
+        col = []
         for i, info in enumerate(ptInfos):
             if(i == 0 or info.size != ptInfos[i-1].size):
-                if(i > 0):
-                    bgl.glPointSize(ptInfos[i-1].size)
-                    batch = batch_for_shader(self.shader, \
-                        'POINTS', {"pos": pos, "color": col})
-                    batch.draw(self.shader)
+                if(i > 0 and len(pos) > 0):
+                    self.ptBatches.append([ptInfos[i-1].size, \
+                        batch_for_shader(self.shader, \
+                            'POINTS', {"pos": pos, "color": col})])
                 pos = []
                 col = []
 
@@ -3688,58 +4122,97 @@ class BGLDrawMgr:
             col += ptCols
 
         if(len(pos) > 0):
-            bgl.glPointSize(ptInfos[-1].size)
-            batch = batch_for_shader(self.shader, \
-                'POINTS', {"pos": pos, "color": col})
+            self.ptBatches.append([ptInfos[-1].size, \
+                batch_for_shader(self.shader, \
+                    'POINTS', {"pos": pos, "color": col})])
+
+    def redraw(self):
+        # Draw handler fires on every viewport redraw; bail out before any
+        # gpu state change or batch creation when there is nothing to show
+        if(all(len(info.pts) == 0 for info in self.lineInfoMap.values()) and \
+            all(len(info.pts) == 0 for info in self.ptInfoMap.values())):
+            return
+
+        if(self.batchRev != self.rev):
+            self.updateBatches()
+            self.batchRev = self.rev
+
+        for size, batch in self.lineBatches:
+            setLineWidth(size)
+            batch.draw(self.shader)
+
+        for size, batch in self.ptBatches:
+            setPointSize(size)
             batch.draw(self.shader)
 
     def resetLineInfo(self, infoId):
         drawInfo = self.lineInfoMap.get(infoId)
         if(drawInfo != None):
             drawInfo.pts = []
+            self.rev += 1
 
     def resetPtInfo(self, infoId):
         drawInfo = self.ptInfoMap.get(infoId)
         if(drawInfo != None):
             drawInfo.pts = []
+            self.rev += 1
 
     def reset(self):
         for key in list(self.ptInfoMap.keys()):
             self.ptInfoMap[key].pts = []
         for key in list(self.lineInfoMap.keys()):
             self.lineInfoMap[key].pts = []
+        self.rev += 1
 
 # Return line batch for bezier line segments and handles and point batch for handle tips
 def updateBezierBatches(bglDrawMgr, segDispInfos, bptDispInfos, areaRegionInfo, \
         defHdlType = 'ALIGNED'):
 
-    lineCos = [] #segment is also made up of lines
-    lineColors = []
-    for i, info in enumerate(segDispInfos):
+    # Two passes: collect the per-info line lists and counts first, then fill
+    # preallocated lists by slice assignment (one C-level copy per info)
+    # instead of growing lineCos / lineColors element by element
+    segLineInfos = [] #segment is also made up of lines
+    lineCnt = 0
+    for info in segDispInfos:
         segPts = info.segPts
         if(isStraightSeg(segPts)):
-            lineCos += [segPts[0][1], segPts[1][1]]
-            lineColors += [info.segColor, info.segColor]
+            segLineCos = [segPts[0][1], segPts[1][1]]
         else:
             pts = getPtsAlongBezier2D(segPts, areaRegionInfo, \
                 FTProps.dispCurveRes, maxRes = MAX_NONSEL_CURVE_RES)
             segLineCos = getLinesFromPts(pts)
-            lineCos += segLineCos
-            lineColors += [info.segColor for j in range(0, len(segLineCos))]
+        segLineInfos.append((segLineCos, info.segColor))
+        lineCnt += len(segLineCos)
 
-    tipCos = []
-    tipColors = []
-    for i, info in enumerate(bptDispInfos):
+    hdlLineInfos = []
+    for info in bptDispInfos:
         pt = info.pt
         for hn in info.handleNos:
-            lineCos += [pt[hn], pt[hn + 1]]
-
             if(len(pt) < 5): htype = defHdlType # For Draw
             else: htype = pt[3 + hn]
+            hdlLineInfos.append((pt[hn], pt[hn + 1], \
+                ModalBaseFlexiOp.hdlColMap[htype]))
+    lineCnt += 2 * len(hdlLineInfos)
 
-            lineColors += [ModalBaseFlexiOp.hdlColMap[htype], \
-                    ModalBaseFlexiOp.hdlColMap[htype]]
+    lineCos = [None] * lineCnt
+    lineColors = [None] * lineCnt
+    idx = 0
+    for segLineCos, segColor in segLineInfos:
+        nextIdx = idx + len(segLineCos)
+        lineCos[idx: nextIdx] = segLineCos
+        lineColors[idx: nextIdx] = [segColor] * len(segLineCos)
+        idx = nextIdx
+    for pt0, pt1, hdlColor in hdlLineInfos:
+        lineCos[idx] = pt0
+        lineCos[idx + 1] = pt1
+        lineColors[idx] = hdlColor
+        lineColors[idx + 1] = hdlColor
+        idx += 2
 
+    tipCos = []
+    tipColors = []
+    for i, info in enumerate(bptDispInfos):
+        pt = info.pt
         # Re-arrange tips so handles are on top of Bezier point
         tc = info.tipColors
         tc = [tc[1], tc[0], tc[2]]
@@ -3755,27 +4228,29 @@ def updateBezierBatches(bglDrawMgr, segDispInfos, bptDispInfos, areaRegionInfo,
 def resetToolbarTool():
     win = bpy.context.window
     scr = win.screen
-    areas3d  = [area for area in scr.areas if area.type == 'VIEW_3D']
     override = {'window':win,'screen':scr, 'scene' :bpy.context.scene}
-    for a in areas3d:
+    for a in scr.areas:
+        if(a.type != 'VIEW_3D'): continue
+        # The tool is set per area; one WINDOW region suffices for the override
+        region = next((r for r in a.regions if r.type == 'WINDOW'), None)
+        if(region == None): continue
         override['area'] = a
-        regions   = [region for region in a.regions if region.type == 'WINDOW']
-        for r in regions:
-            override['region'] = r
-            bpy.ops.wm.tool_set_by_index(override)
+        override['region'] = region
+        bpy.ops.wm.tool_set_by_index(override)
+
+META_BTN_KEYMAP = {'LEFT_SHIFT': 'shift', 'RIGHT_SHIFT': 'shift',
+    'LEFT_CTRL':'ctrl', 'RIGHT_CTRL':'ctrl',
+    'LEFT_ALT': 'alt', 'RIGHT_ALT': 'alt'}
 
 def updateMetaBtns(caller, event, keymap = None):
     if(keymap == None):
-        keymap = {'LEFT_SHIFT': 'shift', 'RIGHT_SHIFT': 'shift',
-            'LEFT_CTRL':'ctrl', 'RIGHT_CTRL':'ctrl',
-            'LEFT_ALT': 'alt', 'RIGHT_ALT': 'alt'}
+        keymap = META_BTN_KEYMAP
 
     var = keymap.get(event.type)
 
     if(var != None):
-        expr = 'caller.' + var + ' = '
-        if(event.value == 'PRESS'): exec(expr +'True')
-        if(event.value == 'RELEASE'): exec(expr +'False')
+        if(event.value == 'PRESS'): setattr(caller, var, True)
+        if(event.value == 'RELEASE'): setattr(caller, var, False)
         return True
 
     return False
@@ -4861,7 +5336,7 @@ class Snapper:
         self.getSelCo = getSelCo
         self.hasSelection = hasSelection
         self.isEditing = isEditing
-        self.angleSnapSteps = Snapper.DEFAULT_ANGLE_SNAP_STEPS
+        self.setAngleSnapSteps(Snapper.DEFAULT_ANGLE_SNAP_STEPS)
         self.customAxis = CustomAxis()
         self.snapDigits = SnapDigits(self.getSnapParamsFreeAxes, self.getEditCoPair)
         self.initialize()
@@ -4869,6 +5344,14 @@ class Snapper:
         # ~ bpy.context.space_data.overlay.show_axis_x = False
         # ~ bpy.context.space_data.overlay.show_axis_y = False
 
+    # Angles and their tans depend only on the step cnt, so refresh them here
+    # instead of on every mouse move within the angle snap block of get3dLoc
+    def setAngleSnapSteps(self, steps):
+        self.angleSnapSteps = steps
+        snapIncr = 45 / steps
+        self.snapAngles = tuple(radians(snapIncr * a) for a in range(0, steps + 1))
+        self.snapTans = tuple(tan(a) for a in self.snapAngles)
+
     def resetMetakeys(self):
         # metakeys for all functions
         self.shift = False
@@ -4891,6 +5374,11 @@ class Snapper:
 
         self.lastSnapTypes = set()
 
+        # [region ptr, persp matrix, (n, 3) locs, kd]; see getSnapLocKd
+        self.kdTreeCache = None
+        # objName -> [(vertCnt, mw), locs]; see getMeshVertLocs
+        self.meshVertCache = {}
+
         self.resetSnap()
 
     def updateSnapKeyMap(self):
@@ -5145,12 +5633,48 @@ class Snapper:
             snapLocs.append(obj.location)
             if(obj.type == 'MESH'):
                 if(vertCnt + len(obj.data.vertices) < self.MAX_SNAP_VERT_CNT):
-                    snapLocs += [obj.matrix_world @ v.co for v in obj.data.vertices]
+                    snapLocs += self.getMeshVertLocs(obj)
                     vertCnt =+ len(obj.data.vertices)
                 else:
                     break
         return snapLocs
 
+    # World space mesh verts change only with the mesh or its matrix (the
+    # mesh itself can't be edited while the modal op runs), so fetch them in
+    # bulk and keep per object rather than transforming per mouse move
+    def getMeshVertLocs(self, obj):
+        verts = obj.data.vertices
+        key = (len(verts), tuple(v for row in obj.matrix_world for v in row))
+        cached = self.meshVertCache.get(obj.name)
+        if(cached != None and cached[0] == key): return cached[1]
+        buf = np.empty(3 * len(verts), dtype = np.single)
+        verts.foreach_get('co', buf)
+        locs = [Vector(co) for co in \
+            transformNpPts(buf.reshape((-1, 3)), obj.matrix_world)]
+        self.meshVertCache[obj.name] = [key, locs]
+        return locs
+
+    # The tree contents rarely change between mouse events, so rebuild only
+    # when the view or the locs themselves did (the array compare is a cheap
+    # C pass vs the O(n log n) project + build)
+    def getSnapLocKd(self, region, rv3d, snapLocs):
+        locs = np.array(snapLocs, dtype = np.single)
+        pm = np.array(rv3d.perspective_matrix, dtype = np.single)
+        cache = self.kdTreeCache
+        if(cache != None and cache[0] == region.as_pointer() and \
+            np.array_equal(cache[1], pm) and np.array_equal(cache[2], locs)):
+            return cache[3]
+
+        cos2d = getCoordsFromLocs(region, rv3d, locs)
+
+        kd = kdtree.KDTree(len(snapLocs))
+        for i, co in enumerate(cos2d):
+            kd.insert((co[0], co[1], 0), i)
+        kd.balance()
+
+        self.kdTreeCache = [region.as_pointer(), pm, locs, kd]
+        return kd
+
     def getTMInfoAndOrig(self, rmInfo, transType, origType, freezeOrient, \
         axisScale, refLineOrig, selCo):
         obj = bpy.context.object
@@ -5225,14 +5749,10 @@ class Snapper:
         # ~ freeAxesG = self.getFreeAxesGlobal()
 
         if(FTProps.dispSnapInd or vertSnap):
-            #TODO: Called very frequently (store the tree [without duplicating data])
             snapLocs = self.getAllSnapLocs((snapToAxisLine and \
                 'AXIS' in {transType, origType, axisScale})) + [orig]
 
-            kd = kdtree.KDTree(len(snapLocs))
-            for i, l in enumerate(snapLocs):
-                kd.insert(getCoordFromLoc(region, rv3d, l).to_3d(), i)
-            kd.balance()
+            kd = self.getSnapLocKd(region, rv3d, snapLocs)
 
             coFind = Vector(xy).to_3d()
             searchResult = kd.find_range(coFind, FTProps.snapDist)
@@ -5290,11 +5810,12 @@ class Snapper:
                         pt = getPtProjOnPlane(region, rv3d, xy, invTm @ loc, \
                             invTm @ ppt1, invTm @ ppt2, invTm @ ppt3)
 
+                        tmPt = tm @ pt if(pt != None) else None
                         for axis in constrAxes:
                             # TODO: Better handling of boundary condition
                             if(pt == None or pt[axis] > 1000):
                                 loc[axis] = refCo[axis]
-                            else: loc[axis] = (tm @ pt)[axis]
+                            else: loc[axis] = tmPt[axis]
                         self.lastSnapTypes.add('axis2')
 
                     if(len(freeAxesN) == 1):
@@ -5353,9 +5874,8 @@ class Snapper:
                     loc = snapStart.copy()
                     loc[axis] = actualLoc[axis]
 
-                    snapIncr = 45 / self.angleSnapSteps
-                    snapAngles = [radians(snapIncr * a) \
-                        for a in range(0, self.angleSnapSteps + 1)]
+                    snapAngles = self.snapAngles
+                    snapTans = self.snapTans
 
                     l1 =  actualLoc[axis] - snapStart[axis] #Main axis diff value
 
@@ -5363,17 +5883,17 @@ class Snapper:
                         if(i != axis and (i in freeAxesN)):
                             l2 =  (actualLoc[i] - snapStart[i]) #Minor axis value
                             angle = abs(atan(l2 / l1)) if l1 != 0 else 0
-                            dirn = (l1 * l2) / abs(l1 * l2) if (l1 * l2) != 0 else 1
+                            dirn = copysign(1, l1 * l2) if (l1 * l2) != 0 else 1
                             prevDiff = LARGE_NO
                             for j in range(0, len(snapAngles) + 1):
                                 if(j == len(snapAngles)):
                                     loc[i] = snapStart[i] + \
-                                        dirn * l1 * tan(snapAngles[-1])
+                                        dirn * l1 * snapTans[-1]
                                     break
                                 cmpAngle = snapAngles[j]
                                 if(abs(angle - cmpAngle) > prevDiff):
                                     loc[i] = snapStart[i] + \
-                                        dirn * l1 * tan(snapAngles[j-1])
+                                        dirn * l1 * snapTans[j-1]
                                     break
                                 prevDiff = abs(angle - cmpAngle)
 
@@ -5524,7 +6044,23 @@ class Snapper:
 #          |                               |
 #    ModalFlexiDrawBezierOp       ModalFlexiDrawGreaseOp
 
+# Stand-in event for the timer flush of a coalesced mouse move; the
+# subModal mouse move paths only read type / value (position comes from
+# self.rmInfo, refreshed from the flushing event)
+class PseudoMouseMoveEvent:
+    type = 'MOUSEMOVE'
+    value = 'NOTHING'
+
 class ModalBaseFlexiOp(Operator):
+
+    # Mouse moves are processed at most at this cadence (rest coalesced);
+    # high-polling-rate mice can otherwise stall the viewport
+    MM_COALESCE_STEP = 1 / 60
+    pseudoMMEvt = PseudoMouseMoveEvent()
+
+    dispBatchKey = None # Input key of the last updateBezierBatches call
+    colorMap = None # Memoized getColorMap result; reset on props change
+    dispInfoEpoch = 0 # Bumped on props change to refresh cached display infos
     running = False
     drawHdlrRef = None
     drawTxtHdlrRef = None
@@ -5640,6 +6176,8 @@ class ModalBaseFlexiOp(Operator):
 
     # Called back after add-on preferences are changed
     def propsChanged():
+        ModalBaseFlexiOp.colorMap = None
+        ModalBaseFlexiOp.dispInfoEpoch += 1
         if(ModalBaseFlexiOp.opObj != None and \
             ModalBaseFlexiOp.opObj.snapper != None):
             ModalBaseFlexiOp.opObj.snapper.updateSnapKeyMap()
@@ -5649,14 +6187,30 @@ class ModalBaseFlexiOp(Operator):
                                 'AUTO': FTProps.colHdlAuto}
 
     def resetDisplayBase():
+        ModalBaseFlexiOp.dispBatchKey = None
         ModalBaseFlexiOp.bglDrawMgr.reset()
         ModalBaseFlexiOp.tagRedraw()
 
     def refreshDisplayBase(segDispInfos, bptDispInfos, snapper):
         areaRegionInfo = getAllAreaRegions()
 
-        updateBezierBatches(ModalDrawBezierOp.bglDrawMgr, segDispInfos, \
-            bptDispInfos, areaRegionInfo)
+        # Rebatch the curve display only if its inputs changed since the
+        # last call (meta key presses etc. refresh only the guides);
+        # key covers all the data updateBezierBatches reads
+        key = (tuple((getSegPtsKey(info.segPts), \
+                tuple(tuple(pt[3:]) for pt in info.segPts), \
+                tuple(info.segColor)) for info in segDispInfos), \
+            tuple((getSegPtsKey([info.pt]), tuple(info.pt[3:]), \
+                tuple(info.handleNos), \
+                tuple(tuple(tc) if(tc != None) else None \
+                    for tc in info.tipColors)) for info in bptDispInfos), \
+            tuple(getViewDistBucket(inf[2].view_distance) \
+                for inf in areaRegionInfo))
+
+        if(key != ModalBaseFlexiOp.dispBatchKey):
+            updateBezierBatches(ModalDrawBezierOp.bglDrawMgr, segDispInfos, \
+                bptDispInfos, areaRegionInfo)
+            ModalBaseFlexiOp.dispBatchKey = key
 
         if(snapper != None):
             snapper.updateGuideBatches(ModalBaseFlexiOp.bglDrawMgr)
@@ -5682,15 +6236,31 @@ class ModalBaseFlexiOp(Operator):
     def getToolType(self):
         raise NotImplementedError('Call to abstract method.')
 
+    # redrawBezier runs per mouse move, so avoid rebuilding the map there;
+    # invalidated on props change and on op invoke
+    def getCachedColorMap(self):
+        if(ModalBaseFlexiOp.colorMap == None):
+            ModalBaseFlexiOp.colorMap = self.getColorMap()
+        return ModalBaseFlexiOp.colorMap
+
     def preInvoke(self, context, event):
         pass # placeholder
 
     def subInvoke(self, context, event):
         return {'RUNNING_MODAL'} # placeholder
 
+    # cursor_set goes through the window manager; skip it when the cursor
+    # already is the requested one (called per mouse move otherwise)
+    def setWMCursor(self, cursor):
+        if(cursor == self.lastCursor): return
+        bpy.context.window.cursor_set(cursor)
+        self.lastCursor = cursor
+
     def invoke(self, context, event):
         ModalBaseFlexiOp.opObj = self
+        ModalBaseFlexiOp.colorMap = None
         ModalBaseFlexiOp.running = True
+        self.lastCursor = None
         self.preInvoke(context, event)
         ModalBaseFlexiOp.addDrawHandlers(context)
 
@@ -5706,6 +6276,7 @@ class ModalBaseFlexiOp(Operator):
 
         ModalBaseFlexiOp.shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
         ModalBaseFlexiOp.bglDrawMgr = BGLDrawMgr(ModalBaseFlexiOp.shader)
+        ModalBaseFlexiOp.dispBatchKey = None
 
         # ~ ModalBaseFlexiOp.shader.bind()
         context.window_manager.modal_handler_add(self)
@@ -5719,6 +6290,12 @@ class ModalBaseFlexiOp(Operator):
         self.clickT, self.pressT = None, None
         self.click, self.doubleClick = False, False
 
+        self.mmTimer = context.window_manager.event_timer_add( \
+            time_step = ModalBaseFlexiOp.MM_COALESCE_STEP, window = context.window)
+        self.mmPending = False
+        self.mmProcT = None
+        self.toolSelT = None
+
         return self.subInvoke(context, event)
 
     def modal(self, context, event):
@@ -5726,23 +6303,34 @@ class ModalBaseFlexiOp(Operator):
         snapper = self.snapper
         if(event.type == 'WINDOW_DEACTIVATE' and event.value == 'PRESS'):
             snapper.initialize()
+            self.toolSelT = None
             return {'PASS_THROUGH'}
 
-        if(not self.isToolSelected(context)): # Subclass
+        # Single drift-free clock read per event, shared by the click and
+        # coalescing logic below
+        now = time.monotonic()
+
+        # The workspace tool walk runs per event; memoize it briefly since
+        # high-polling-rate mice deliver many events within a single frame
+        if(self.toolSelT == None or (now - self.toolSelT) >= \
+            ModalBaseFlexiOp.MM_COALESCE_STEP):
+            self.toolSel = self.isToolSelected(context) # Subclass
+            self.toolSelT = now
+
+        if(not self.toolSel):
             self.cancelOp(context)
             return {"CANCELLED"}
 
         self.click, self.doubleClick = False, False
         if(event.type == 'LEFTMOUSE'):
             if(event.value == 'PRESS'):
-                self.pressT = time.time()
+                self.pressT = now
             elif(event.value == 'RELEASE'):
-                t = time.time()
-                if(self.clickT != None and (t - self.clickT) < DBL_CLK_DURN):
+                if(self.clickT != None and (now - self.clickT) < DBL_CLK_DURN):
                     self.clickT = None
                     self.doubleClick = True
-                elif(self.pressT != None and (t - self.pressT) < SNGL_CLK_DURN):
-                    self.clickT = t
+                elif(self.pressT != None and (now - self.pressT) < SNGL_CLK_DURN):
+                    self.clickT = now
                     self.click = True
                 self.pressT = None
 
@@ -5806,9 +6394,27 @@ class ModalBaseFlexiOp(Operator):
             return {'RUNNING_MODAL'}
 
         evtCons = (evtCons or (snapProc == EVT_META_OR_SNAP))
+
+        # Coalesce mouse moves to the timer cadence: only the latest position
+        # matters, and the timer flush picks it up via rmInfo above
+        if(event.type == 'MOUSEMOVE' and not evtCons):
+            if(self.mmProcT != None and \
+                (now - self.mmProcT) < ModalBaseFlexiOp.MM_COALESCE_STEP):
+                self.mmPending = True
+                return {'RUNNING_MODAL'}
+            self.mmProcT = now
+        elif(event.type == 'TIMER' and self.mmPending):
+            self.mmPending = False
+            self.mmProcT = now
+            return self.subModal(context, ModalBaseFlexiOp.pseudoMMEvt, evtCons)
+
         return self.subModal(context, event, evtCons)
 
     def cancelOpBase(self):
+        if(self.mmTimer != None):
+            bpy.context.window_manager.event_timer_remove(self.mmTimer)
+            self.mmTimer = None
+
         for a in bpy.context.screen.areas:
             if (a.type == 'VIEW_3D'): a.header_text_set(None)
 
@@ -5844,18 +6450,39 @@ class BaseDraw:
 
     def initialize(self):
         self.curvePts = []
+        # Contiguous mirror of the pt coords (lt, co, rt rows), so batch ops
+        # can slice it instead of walking the boxed Vectors; grows by doubling
+        self.curvePtBuf = np.empty((64, 3, 3), dtype = np.single)
 
     def newPoint(self, loc, ltype, rtype):
         self.curvePts.append([loc, loc, loc, ltype, rtype])
+        cnt = len(self.curvePts)
+        if(cnt > len(self.curvePtBuf)):
+            buf = np.empty((2 * len(self.curvePtBuf), 3, 3), dtype = np.single)
+            buf[:cnt - 1] = self.curvePtBuf
+            self.curvePtBuf = buf
+        self.curvePtBuf[cnt - 1] = (loc, loc, loc)
 
     def setCurvePt(self, idx, pt):
         self.curvePts[idx] = pt
+        if(idx < 0): idx += len(self.curvePts)
+        self.curvePtBuf[idx] = (pt[0], pt[1], pt[2])
 
     def popCurvePt(self):
         self.curvePts.pop()
 
     def setCurvePts(self, curvePts):
         self.curvePts = curvePts
+        cnt = len(curvePts)
+        cap = len(self.curvePtBuf)
+        if(cnt > cap):
+            while(cap < cnt): cap *= 2
+            self.curvePtBuf = np.empty((cap, 3, 3), dtype = np.single)
+        for i, pt in enumerate(curvePts):
+            self.curvePtBuf[i] = (pt[0], pt[1], pt[2])
+
+    def getCurvePtCos(self):
+        return self.curvePtBuf[:len(self.curvePts)]
 
 class Primitive2DDraw(BaseDraw):
 
@@ -6973,7 +7600,7 @@ class BezierDraw(BaseDraw):
         # ~ if ((snapProc and not snapper.digitsConfirmed) \
         if (snapProc or event.type == 'MOUSEMOVE'):
 
-            bpy.context.window.cursor_set("DEFAULT")
+            self.parent.setWMCursor("DEFAULT")
             hdlPtIdxs = None
             if(len(self.curvePts) > 0):
                 if(self.capture):
@@ -7114,6 +7741,7 @@ class ModalDrawBezierOp(ModalBaseFlexiOp):
         return self.cancelOpBase()
 
     def postUndoRedo(self, scene, dummy = None): # signature different in 2.8 and 2.81?
+        clearBptDataCache()
         self.updateSnapLocs() # subclass method
 
     def confirm(self, context, event, location = None):
@@ -7139,7 +7767,7 @@ class ModalDrawBezierOp(ModalBaseFlexiOp):
         return self.drawObj.procDrawEvent(context, event, snapProc)
 
     def refreshMarkerPos(self, rmInfo):
-        colMap = self.getColorMap()
+        colMap = self.getCachedColorMap()
         colMarker = colMap['MARKER_COLOR']
         markerLoc = self.snapper.get3dLocSnap(rmInfo)
 
@@ -7162,7 +7790,7 @@ class ModalDrawBezierOp(ModalBaseFlexiOp):
 
         self.bglDrawMgr.resetPtInfo('drawMarker')
 
-        colMap = self.getColorMap()
+        colMap = self.getCachedColorMap()
         colSelSeg = colMap['SEL_SEG_COLOR']
         colNonAdjSeg = colMap['NONADJ_SEG_COLOR']
         colTip = colMap['TIP_COLOR']
@@ -7215,6 +7843,7 @@ class ModalFlexiDrawBezierOp(ModalDrawBezierOp):
 
     # For some curve-changing ops (like reset rotation); possible in draw
     def updateAfterGeomChange(self, scene = None, dummy = None): # 3 params in 2.81
+        clearBptDataCache()
         self.updateSnapLocs()
 
     def isToolSelected(self, context):
@@ -7278,6 +7907,27 @@ class ModalFlexiDrawBezierOp(ModalDrawBezierOp):
 
     def updateSnapLocs(self, objNames = None):
         updateCurveEndPtMap(self.snapInfos, addObjNames = objNames)
+        self.updateSnapObjKd()
+
+    # KDTree over open spline end pts so getSnapObjs is a log(n) lookup
+    # (refreshed together with snapInfos, also on undo / redo)
+    def updateSnapObjKd(self):
+        entries = []
+        for objName, infos in self.snapInfos.items():
+            obj = bpy.context.scene.objects.get(objName)
+            if(obj == None or not isBezier(obj)): continue
+            splines = obj.data.splines
+            for i, pts in infos:
+                if(i >= len(splines) or splines[i].use_cyclic_u or \
+                    len(pts) == 0): continue
+                entries.append([pts[0], objName, i, 0])
+                entries.append([pts[-1], objName, i, -1])
+        kd = kdtree.KDTree(len(entries))
+        for idx, entry in enumerate(entries):
+            kd.insert(entry[0], idx)
+        kd.balance()
+        self.snapObjKd = kd
+        self.snapObjMap = [entry[1:] for entry in entries]
 
     def createCurveObj(self, context, startObj = None, \
         startSplineIdx = None, endObj = None, endSplineIdx = None, autoclose = False):
@@ -7345,26 +7995,16 @@ class ModalFlexiDrawBezierOp(ModalDrawBezierOp):
 
         return obj
 
-    #TODO: At least store in map instead of linear search
     def getSnapObjs(self, context, locs):
-        retVals = [[None, 0, 0]] * len(locs)
-        foundVals = 0
-        for obj in bpy.data.objects:
-            if(isBezier(obj)):
-                mw = obj.matrix_world
-                for i, s in enumerate(obj.data.splines):
-                    if(s.use_cyclic_u or len(s.bezier_points) == 0): continue
-                    for j, loc in enumerate(locs):
-                        p = s.bezier_points[0]
-                        if(vectCmpWithMargin(loc, mw @ p.co)):
-                            retVals[j] = [obj, i, 0]
-                            foundVals += 1
-                        p = s.bezier_points[-1]
-                        if(vectCmpWithMargin(loc, mw @ p.co)):
-                            retVals[j] = [obj, i, -1]
-                            foundVals += 1
-                        if(foundVals == len(locs)):
-                            return retVals
+        retVals = []
+        for loc in locs:
+            retVal = [None, 0, 0]
+            co, idx, dist = self.snapObjKd.find(loc)
+            if(idx != None and vectCmpWithMargin(loc, co)):
+                objName, splineIdx, endIdx = self.snapObjMap[idx]
+                obj = bpy.context.scene.objects.get(objName)
+                if(obj != None): retVal = [obj, splineIdx, endIdx]
+            retVals.append(retVal)
         return retVals
 
     def save(self, context, event, autoclose, location, align = True):
@@ -7508,6 +8148,10 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
         super(ModalFlexiDrawGreaseOp, self).initialize()
         self.subdivCos = []
         self.interpPts = []
+        self.segLenCache = {}
+        self.interpPtsKey = None
+        self.pendingSubdivIncr = 0
+        self.curveLen = 0
         self.updateSnapLocs()
 
     def subModal(self, context, event, snapProc):
@@ -7515,6 +8159,14 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
         rmInfo = self.rmInfo
         metakeys = self.snapper.getMetakeys()
 
+        # Wheel ticks only accumulate the incr; the resample below runs
+        # once per timer event however fast the events come in
+        if(event.type == 'TIMER' and self.pendingSubdivIncr != 0):
+            self.subdivAdd(self.pendingSubdivIncr)
+            self.pendingSubdivIncr = 0
+            self.redrawBezier(rmInfo)
+            return {'RUNNING_MODAL'}
+
         if(not metakeys[2]):
             cntIncr = 5 #if(self.isDrawShape) else 5
 
@@ -7525,11 +8177,10 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
                     and event.value == 'PRESS'):
                     return {'RUNNING_MODAL'}
                 elif(event.type =='WHEELUPMOUSE' or event.type.endswith('PLUS')):
-                    self.subdivAdd(cntIncr)
+                    self.pendingSubdivIncr += cntIncr
                 elif(event.type =='WHEELDOWNMOUSE' or event.type.endswith('MINUS')):
-                    self.subdivAdd(-cntIncr)
+                    self.pendingSubdivIncr -= cntIncr
 
-                self.redrawBezier(rmInfo)
                 return {'RUNNING_MODAL'}
 
         if(event.type == 'H' or event.type == 'h'):
@@ -7552,19 +8203,39 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
                 self.snapLocs.append(curvePts[0][1])
             if(len(curvePts) > 1):
                 slens = self.getCurveSegLens()
-                self.updateInterpPts(slens)
-                self.updateSubdivCos(sum(slens))
+                self.curveLen = sum(slens)
+                # Fixed pts (all but the moving one) determine the interp /
+                # subdiv data; skip the recompute while they are unchanged
+                interpKey = (len(curvePts), self.subdivPerUnit, \
+                    getSegPtsKey(curvePts[:-1])) \
+                        if(self.drawType == 'BEZIER') else None
+                if(interpKey == None or interpKey != self.interpPtsKey):
+                    self.updateInterpPts(slens)
+                    self.updateSubdivCos(self.curveLen)
+                    self.interpPtsKey = interpKey
                 self.redrawBezier(rmInfo)
 
         return retVal
 
+    # Only the tail segs change while drawing, so the arc-length
+    # integration runs once per seg, not once per event
     def getCurveSegLens(self):
         clen = []
-        curvePts = self.drawObj.curvePts
-
-        for i in range(1, len(curvePts) - 1):
-            clen.append(getSegLen([curvePts[i-1][1], curvePts[i-1][2], \
-                curvePts[i][0], curvePts[i][1]]))
+        cos = self.drawObj.getCurvePtCos()
+        cache = self.segLenCache
+
+        if(len(cos) < 3): return clen
+        # (co, rt) of pt i with (lt, co) of pt i + 1 -> seg ctrl pts
+        segs = np.concatenate((cos[:-2, 1:], cos[1:-1, :2]), axis = 1)
+        keys = np.round(segs, 6)
+        for i in range(len(segs)):
+            key = tuple(keys[i].ravel())
+            slen = cache.get(key)
+            if(slen == None):
+                if(len(cache) > 4096): cache.clear()
+                slen = getSegLen(segs[i])
+                cache[key] = slen
+            clen.append(slen)
         return clen
 
     def updateSubdivCos(self, clen = None):
@@ -7587,13 +8258,10 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
         return self.interpPts
 
     def subdivAdd(self, addCnt):
-        slens = self.getCurveSegLens()
-        clen = sum(slens)
+        clen = self.curveLen
         if(clen == 0): return
-        cnt = self.subdivPerUnit * clen + addCnt
-        if(cnt < 1): cnt = 1
-
-        self.subdivPerUnit = (cnt / clen)
+        # Same as (subdivPerUnit * clen + addCnt) / clen with cnt >= 1
+        self.subdivPerUnit = max(1 / clen, self.subdivPerUnit + addCnt / clen)
         self.updateSubdivCos(clen)
 
     def getSnapLocsImpl(self):
@@ -7626,17 +8294,16 @@ class ModalFlexiDrawGreaseOp(ModalDrawBezierOp):
 
             stroke = frame.strokes.new()
             stroke.display_mode = '3DSPACE'
-            stroke.points.add(count = len(self.subdivCos))
-            for i in range(0, len(self.subdivCos)):
-                pt = self.subdivCos[i]
-                stroke.points[i].co = self.gpencil.matrix_world.inverted_safe() @ pt
-                stroke.points[i].strength = strength
-            if(autoclose):
-                stroke.points.add(count = 1)
-                stroke.points[-1].co = stroke.points[0].co.copy()
-                stroke.points[-1].strength = strength
+            ptCnt = len(self.subdivCos) + (1 if autoclose else 0)
+            stroke.points.add(count = ptCnt)
+            cos = transformNpPts(np.array(self.subdivCos, \
+                dtype = np.single), invMw)
+            if(autoclose): cos = np.concatenate((cos, cos[:1]))
+            stroke.points.foreach_set('co', cos.ravel())
+            stroke.points.foreach_set('strength', \
+                np.full(ptCnt, strength, dtype = np.single))
             stroke.line_width = lineWidth
-            self.snapLocs += [self.subdivCos[0][1], self.subdivCos[-1][1]]
+            self.snapLocs += [self.subdivCos[0], self.subdivCos[-1]]
         bpy.ops.ed.undo_push()
 
 ################### Flexi Edit Bezier Curve ###################
@@ -7647,9 +8314,31 @@ class EditSegDisplayInfo(SegDisplayInfo):
         super(EditSegDisplayInfo, self).__init__(segPts, segColor)
         self.subdivCos = subdivCos
 
+# Cached only while a Flexi op runs, since the ops' depsgraph / undo
+# handlers are what clears it; rows are copied out on both store and hit
+# because callers scratch-mutate the returned lists
+BPT_DATA_CACHE = {}
+
+def clearBptDataCache():
+    BPT_DATA_CACHE.clear()
+    NONSEL_SEARCH_CACHE['key'] = None
+
+# Worldspace search pts of the non-selected objs in getClosestPt2d; these
+# only change with the geometry (cleared above) or the tessellation density
+NONSEL_SEARCH_CACHE = {'key': None, 'data': None}
+
 # fromMix True: points after shape key value / eval_time applied
 def getBptData(obj, withShapeKey = True, shapeKeyIdx = None, fromMix = True, \
     updateDeps = False, local = False):
+    cacheKey = (obj.name, withShapeKey, shapeKeyIdx, fromMix, local) \
+        if(ModalBaseFlexiOp.running) else None
+    if(cacheKey != None):
+        cached = BPT_DATA_CACHE.get(cacheKey)
+        if(cached != None):
+            # Copy the Vectors too; callers mutate them in place
+            return [[[p.copy() if isinstance(p, Vector) else p for p in pt] \
+                for pt in splinePts] for splinePts in cached]
+
     # Less readable but more convenient than class
     # Format: [handle_left, co, handle_right, handle_left_type, handle_right_type]
     worldSpaceData = []
@@ -7677,20 +8366,44 @@ def getBptData(obj, withShapeKey = True, shapeKeyIdx = None, fromMix = True, \
             keyBlock = obj.data.shape_keys.key_blocks[shapeKeyIdx]
         keydata = keyBlock.data
 
-    for spline in obj.data.splines:
-        pts = []
-        for pt in spline.bezier_points:
-            lt, rt = pt.handle_left_type, pt.handle_right_type
-            if(keydata != None):
-                pt = keydata[dataIdx]
-                dataIdx += 1
+    if(keydata != None):
+        keyHls = np.empty(3 * len(keydata), dtype = np.single)
+        keyCos = np.empty_like(keyHls)
+        keyHrs = np.empty_like(keyHls)
+        keydata.foreach_get('handle_left', keyHls)
+        keydata.foreach_get('co', keyCos)
+        keydata.foreach_get('handle_right', keyHrs)
+        keyHls = keyHls.reshape((-1, 3))
+        keyCos = keyCos.reshape((-1, 3))
+        keyHrs = keyHrs.reshape((-1, 3))
 
-            pts.append([mw @ pt.handle_left, mw @ pt.co, mw @ pt.handle_right, lt, rt])
-        worldSpaceData.append(pts)
+    for spline in obj.data.splines:
+        bpts = spline.bezier_points
+        cnt = len(bpts)
+        if(keydata != None):
+            hls, cos, hrs = (buf[dataIdx: dataIdx + cnt] \
+                for buf in (keyHls, keyCos, keyHrs))
+            dataIdx += cnt
+        else:
+            hls = getBptVecBuf(bpts, 'handle_left')
+            cos = getBptVecBuf(bpts, 'co')
+            hrs = getBptVecBuf(bpts, 'handle_right')
+        hls = transformNpPts(hls, mw)
+        cos = transformNpPts(cos, mw)
+        hrs = transformNpPts(hrs, mw)
+        lts = getBptEnumBuf(bpts, 'handle_left_type')
+        rts = getBptEnumBuf(bpts, 'handle_right_type')
+        worldSpaceData.append([[Vector(hls[i]), Vector(cos[i]), Vector(hrs[i]), \
+            HDL_TYPE_MAP[lts[i]], HDL_TYPE_MAP[rts[i]]] for i in range(cnt)])
     if(tmpsk != None):
         obj.shape_key_remove(tmpsk)
         obj.active_shape_key_index = shapeKeyIdx
         if(updateDeps): bpy.context.evaluated_depsgraph_get().update()
+
+    if(cacheKey != None):
+        BPT_DATA_CACHE[cacheKey] = \
+            [[[p.copy() if isinstance(p, Vector) else p for p in pt] \
+                for pt in splinePts] for splinePts in worldSpaceData]
     return worldSpaceData
 
 #TODO: splineIdx not needed if ptCnt given
@@ -7705,13 +8418,19 @@ def getAdjIdx(obj, splineIdx, startIdx, offset = 1, ptCnt = None):
 
 def getBezierDataForSeg(obj, splineIdx, segIdx, withShapeKey = True, shapeKeyIdx = None, \
     fromMix = True, updateDeps = False):
-    wsData = getBptData(obj, withShapeKey, shapeKeyIdx, fromMix, updateDeps)
-    pt0 = wsData[splineIdx][segIdx]
     segEndIdx = getAdjIdx(obj, splineIdx, segIdx)
     if(segEndIdx == None):
         return []
-    pt1 = wsData[splineIdx][segEndIdx]
-    return [pt0, pt1]
+    # Shape key data comes from the (evaluated) key blocks, so the full
+    # fetch is needed; otherwise just transform the two pts of the seg
+    if(updateDeps or (withShapeKey and obj.active_shape_key != None)):
+        wsData = getBptData(obj, withShapeKey, shapeKeyIdx, fromMix, updateDeps)
+        return [wsData[splineIdx][segIdx], wsData[splineIdx][segEndIdx]]
+    mw = obj.matrix_world
+    bpts = obj.data.splines[splineIdx].bezier_points
+    return [[mw @ bpts[i].handle_left, mw @ bpts[i].co, mw @ bpts[i].handle_right, \
+        bpts[i].handle_left_type, bpts[i].handle_right_type] \
+            for i in (segIdx, segEndIdx)]
 
 def getSegPtsInSpline(wsData, splineIdx, ptIdx, cyclic):
     splinePts = wsData[splineIdx]
@@ -7756,12 +8475,25 @@ def getClosestPt2d(region, rv3d, coFind, objs, selObjInfos, withHandles = True,
 
     objSplineEndPts = []
 
-    for obj in objs:
-        #TODO: Check of shape key bounding box
-        if(obj.active_shape_key == None and \
-            not isPtIn2dBBox(obj, region, rv3d, coFind, FTProps.snapDist)):
-            continue
-
+    #TODO: Check of shape key bounding box
+    searchObjs = [obj for obj in objs if(obj.active_shape_key != None or \
+        isPtIn2dBBox(obj, region, rv3d, coFind, FTProps.snapDist))]
+
+    # Pts are worldspace, so only a geom change (cleared with the bpt data
+    # cache) or a zoom past the tessellation bucket invalidates them
+    cacheKey = (tuple(obj.name for obj in searchObjs), withObjs, withBezPts, \
+        withShapeKey, tuple(getViewDistBucket(info[2].view_distance) \
+            for info in getAllAreaRegions())) \
+                if(ModalBaseFlexiOp.running) else None
+
+    cacheHit = (cacheKey != None and NONSEL_SEARCH_CACHE['key'] == cacheKey)
+    if(cacheHit):
+        objLocList, objInterpLocs, objInterpCounts, objBezPtCounts, \
+            objSplineEndPts, objInterpNp, objEndPtNp = \
+                NONSEL_SEARCH_CACHE['data']
+        searchObjs = []
+
+    for obj in searchObjs:
         wsDataSK = None
         # Curve data with shape key value applied (if shape key exists)
         wsData = getBptData(obj, fromMix = True, updateDeps = True)
@@ -7793,6 +8525,16 @@ def getClosestPt2d(region, rv3d, coFind, objs, selObjInfos, withHandles = True,
                         cnt += 1
                     objBezPtCounts.append(cnt)
 
+    if(not cacheHit):
+        # Stacked once here so cache hits skip the Vector list conversion
+        objInterpNp = np.array(objInterpLocs, dtype = np.single).reshape((-1, 3))
+        objEndPtNp = np.array(objSplineEndPts, dtype = np.single).reshape((-1, 3))
+        if(cacheKey != None):
+            NONSEL_SEARCH_CACHE['key'] = cacheKey
+            NONSEL_SEARCH_CACHE['data'] = (objLocList, objInterpLocs, \
+                objInterpCounts, objBezPtCounts, objSplineEndPts, \
+                    objInterpNp, objEndPtNp)
+
     selObjLocList = [] # For mapping after search returns
     selObjHdlList = [] # Better to create a new one, even if some redundancy
 
@@ -7850,15 +8592,29 @@ def getClosestPt2d(region, rv3d, coFind, objs, selObjInfos, withHandles = True,
     searchPtsList[3], retStr[3] = objInterpLocs, 'CurveLoc'
 
     # TODO: Remove duplicates before sending for search?
-    searchPtsList = [[getCoordFromLoc(region, rv3d, pt).to_3d() \
-        for pt in pts] for pts in searchPtsList]
+    # Single batched projection + distance pass instead of per-pt
+    # projections and a KDTree rebuilt on every search; the non-sel pts
+    # come pre-stacked (and cached), only the small sel lists get converted
+    allLocs = np.concatenate((\
+        np.array(hdls, dtype = np.single).reshape((-1, 3)), objEndPtNp, \
+        np.array(segInterpLocs, dtype = np.single).reshape((-1, 3)), \
+            objInterpNp))
+    if(len(allLocs) == 0):
+        return None
 
-    srs = NestedListSearch(searchPtsList).findInLists(coFind, \
-        searchRange = FTProps.snapDist)
+    cos2d = getCoordsFromLocs(region, rv3d, allLocs)
+    dists = np.linalg.norm(cos2d - \
+        np.array(coFind[:2], dtype = np.single), axis = 1)
+    inRange = np.nonzero(dists <= FTProps.snapDist)[0]
 
-    if(len(srs) == 0):
+    if(len(inRange) == 0):
         return None
 
+    cumulCnts = np.cumsum([len(pts) for pts in searchPtsList])
+    listIdxs = np.searchsorted(cumulCnts, inRange, side = 'right')
+    srs = [[int(li), int(fi - (cumulCnts[li - 1] if(li > 0) else 0)), \
+        Vector(cos2d[fi]), float(dists[fi])] for li, fi in zip(listIdxs, inRange)]
+
     sr = min(srs, key = lambda x: x[3])
 
     if(sr[0] > 1):
@@ -7894,12 +8650,7 @@ class NestedListSearch:
     # Find the list element containing the given idx from flattened list
     # return the index of the list element containing the idx
     def findListIdx(counts, idx):
-        cumulCnt = 0
-        cntIdx= 0
-        while(idx >= cumulCnt):
-            cumulCnt += counts[cntIdx] # cntIdx can never be >= len(counts)
-            cntIdx += 1
-        return cntIdx - 1
+        return int(np.searchsorted(np.cumsum(counts), idx, side = 'right'))
 
     def __init__(self, ptsList):
         self.ptsList = ptsList
@@ -7912,6 +8663,7 @@ class NestedListSearch:
                 self.kd.insert(pt, idx)
                 idx += 1
         self.kd.balance()
+        self.cumulCnts = np.cumsum(self.counts)
 
     def findInLists(self, coFind, searchRange):
         if(searchRange == None):
@@ -7922,8 +8674,8 @@ class NestedListSearch:
 
         searchResults = []
         for co, idx, dist in foundVals:
-            listIdx = NestedListSearch.findListIdx(self.counts, idx)
-            ptIdxInList = idx - sum(len(self.ptsList[i]) for i in range(0, listIdx))
+            listIdx = int(np.searchsorted(self.cumulCnts, idx, side = 'right'))
+            ptIdxInList = idx - (self.cumulCnts[listIdx - 1] if(listIdx > 0) else 0)
             searchResults.append([listIdx, ptIdxInList, co, dist])
 
         return searchResults
@@ -7952,10 +8704,18 @@ class SelectCurveInfo:
         # hdlIdx - {-1, 0, 1, 2} similar to sel in ptSels
         self.clickInfo = {}
 
+        # Built display infos (sans highlight); see getDisplayInfos
+        self.dispInfoCache = None
+
     def __hash__(self):
         return hash((self.objName, self.splineIdx))
 
     def updateWSData(self):
+        # Called right after spline writes; clear at write time so readers
+        # outside this op (e.g. the colorCurves depsgraph handler, which may
+        # run before markGeomChange) never get pre-edit cached data
+        clearBptDataCache()
+        self.dispInfoCache = None
         self.hasShapeKey = (self.obj.active_shape_key != None)
         self.shapeKeyIdx = self.obj.active_shape_key_index if self.hasShapeKey else -1
 
@@ -8014,8 +8774,25 @@ class SelectCurveInfo:
                 hdlIdx = 1
                 if(t > higherT): ptIdx = nextIdx
             else:
+                #****************************************************************
+                # Magic Bezier Drag Equations (Courtesy: Inkscape)             #*
+                #****************************************************************
+                                                                               #*
+                if (t <= 1.0 / 6.0):                                           #*
+                    weight = 0                                                 #*
+                elif (t <= 0.5):                                               #*
+                    weight = (pow((6 * t - 1) / 2.0, 3)) / 2                   #*
+                elif (t <= 5.0 / 6.0):                                         #*
+                    weight = (1 - pow((6 * (1-t) - 1) / 2.0, 3)) / 2 + 0.5     #*
+                else:                                                          #*
+                    weight = 1                                                 #*
+                                                                               #*
+                #****************************************************************
+                # t is fixed for the drag, so the offset factors are constants
                 self.clickInfo = {'ptIdx': ptIdx, 'hdlIdx': hdlIdx, \
-                    'loc':clickLoc, 't':t}
+                    'loc':clickLoc, 't':t, \
+                        'c0': (1 - weight) / (3 * t * (1 - t) * (1 - t)), \
+                            'c1': weight / (3 * t * t * (1 - t))}
 
         if(self.clickInfo == None):
             self.clickInfo = {'ptIdx': ptIdx, 'hdlIdx': hdlIdx}
@@ -8391,79 +9168,103 @@ class SelectCurveInfo:
         cAdjBezTip = FTProps.colAdjBezTip
         cNonHltSeg = FTProps.colDrawNonHltSeg
 
-        segDispInfos = []
-        bptDispInfos = []
-
-        pts = self.wsData[:]
         ptSels = self.ptSels
-        if(newPos != None):
-            # TODO: This method is in EditCurveInfo
-            nPtIdxs, nPts = self.getOffsetSegPts(newPos)
-            # Update list with new position (editing)
-            for i, ptIdx in enumerate(nPtIdxs): pts[ptIdx] = nPts[i]
-        elif(deltaPos != None):
-            pts, ptSels = self.getBevelPts(bevelCnt, pts, deltaPos)
-
-        # Default display of spline
-        for i, pt in enumerate(pts):
-            bptDispInfos.append(BptDisplayInfo(pt, [cAdjBezTip]))
-            if(i > 0):
-                segDispInfos.append(SegDisplayInfo([pts[i-1], pt], cNonHltSeg))
-        lastIdx = self.getAdjIdx(len(self.wsData) - 1) # In case cyclic...
-        if(lastIdx != None):
-            segDispInfos.append(SegDisplayInfo([pts[-1], pts[0]], cNonHltSeg))
+
+        # Hover-to-hover only the highlight changes, so the built lists are
+        # cached and the highlight patched onto copies of the entries below
+        cacheKey = (hideHdls, subdivCnt, ModalBaseFlexiOp.dispInfoEpoch, \
+            tuple((p, tuple(sorted(s))) for p, s in sorted(ptSels.items()))) \
+                if(newPos == None and deltaPos == None) else None
+
+        if(cacheKey != None and self.dispInfoCache != None and \
+            self.dispInfoCache[0] == cacheKey):
+            segDispInfos, bptDispInfos = self.dispInfoCache[1]
+            segDispInfos = segDispInfos[:]
+            bptDispInfos = bptDispInfos[:]
+        else:
+            segDispInfos = []
+            bptDispInfos = []
+
+            pts = self.wsData[:]
+            if(newPos != None):
+                # TODO: This method is in EditCurveInfo
+                nPtIdxs, nPts = self.getOffsetSegPts(newPos)
+                # Update list with new position (editing)
+                for i, ptIdx in enumerate(nPtIdxs): pts[ptIdx] = nPts[i]
+            elif(deltaPos != None):
+                pts, ptSels = self.getBevelPts(bevelCnt, pts, deltaPos)
+
+            # Default display of spline
+            for i, pt in enumerate(pts):
+                bptDispInfos.append(BptDisplayInfo(pt, [cAdjBezTip]))
+                if(i > 0):
+                    segDispInfos.append(SegDisplayInfo([pts[i-1], pt], cNonHltSeg))
+            lastIdx = self.getAdjIdx(len(self.wsData) - 1) # In case cyclic...
+            if(lastIdx != None):
+                segDispInfos.append(SegDisplayInfo([pts[-1], pts[0]], cNonHltSeg))
+
+            # Process selections
+            for ptIdx in sorted(ptSels.keys()):
+                sels = ptSels[ptIdx]
+
+                if(hideHdls):
+                    tipColors = [None, cBezPt, None]
+                    handleNos = []
+                else:
+                    tipColors = [cHdlPt, cBezPt, cHdlPt]
+                    handleNos = [0, 1]
+
+                bptDispInfos[ptIdx].tipColors = tipColors[:]
+                bptDispInfos[ptIdx].handleNos = handleNos
+
+                for hdlIdx in sorted(sels): # Start with seg selection i. e. -1
+                    if(hdlIdx == -1):
+                        nextIdx = getAdjIdx(self.obj, self.splineIdx, ptIdx, ptCnt = len(pts))
+                        segPts = [pts[ptIdx], pts[nextIdx]]
+
+                        # process next only if there are no selection pts with that idx
+                        if(nextIdx not in ptSels.keys()):
+                            bptDispInfos[nextIdx].tipColors = tipColors[:]
+                            bptDispInfos[nextIdx].handleNos = handleNos
+
+                        vertCos = []
+                        if(subdivCnt > 1):
+                            vertCos = getInterpolatedVertsCo(self.interpPts[ptIdx], \
+                                subdivCnt)[1:-1]
+
+                        selSegDispInfo = EditSegDisplayInfo(segPts, \
+                            FTProps.colDrawSelSeg, vertCos)
+                        segDispInfos[ptIdx] = selSegDispInfo
+                    elif(hdlIdx == 1 or not hideHdls):
+                        bptDispInfos[ptIdx].tipColors[hdlIdx] = FTProps.colSelTip
+
+            if(cacheKey != None):
+                self.dispInfoCache = [cacheKey, \
+                    [segDispInfos[:], bptDispInfos[:]]]
 
         hltInfo = self.getHltInfo()
         hltPtIdx = hltInfo.get('ptIdx')
         hltIdx = hltInfo.get('hltIdx')
 
-        # Process highlighted segments before selected ones because...
-        # selected segments take priority over highlighted
+        # Patched on entry copies so the cached base stays pristine; the
+        # conditions keep the original priority of selected over highlighted
         if(hltIdx == -1):
-            segDispInfos[hltPtIdx].segColor = FTProps.colDrawHltSeg
-            bptDispInfos[hltPtIdx].tipColors[1] = cBezPt
-            nextIdx = self.getAdjIdx(hltPtIdx)
-            bptDispInfos[nextIdx].tipColors[1] = cBezPt
-
-        # Process selections
-        for ptIdx in sorted(ptSels.keys()):
-            sels = ptSels[ptIdx]
-
-            if(hideHdls):
-                tipColors = [None, cBezPt, None]
-                handleNos = []
-            else:
-                tipColors = [cHdlPt, cBezPt, cHdlPt]
-                handleNos = [0, 1]
-
-            bptDispInfos[ptIdx].tipColors = tipColors[:]
-            bptDispInfos[ptIdx].handleNos = handleNos
-
-            for hdlIdx in sorted(sels): # Start with seg selection i. e. -1
-                if(hdlIdx == -1):
-                    nextIdx = getAdjIdx(self.obj, self.splineIdx, ptIdx, ptCnt = len(pts))
-                    segPts = [pts[ptIdx], pts[nextIdx]]
-
-                    # process next only if there are no selection pts with that idx
-                    if(nextIdx not in ptSels.keys()):
-                        bptDispInfos[nextIdx].tipColors = tipColors[:]
-                        bptDispInfos[nextIdx].handleNos = handleNos
-
-                    vertCos = []
-                    if(subdivCnt > 1):
-                        vertCos = getInterpolatedVertsCo(self.interpPts[ptIdx], \
-                            subdivCnt)[1:-1]
-
-                    selSegDispInfo = EditSegDisplayInfo(segPts, \
-                        FTProps.colDrawSelSeg, vertCos)
-                    segDispInfos[ptIdx] = selSegDispInfo
-                elif(hdlIdx == 1 or not hideHdls):
-                    bptDispInfos[ptIdx].tipColors[hdlIdx] = FTProps.colSelTip
-
-        # Process highlighted points after selected ones because...
-        # highlighted points take priority over selected
+            if(-1 not in ptSels.get(hltPtIdx, set())):
+                segDispInfos[hltPtIdx] = SegDisplayInfo(\
+                    segDispInfos[hltPtIdx].segPts, FTProps.colDrawHltSeg)
+            for idx in (hltPtIdx, self.getAdjIdx(hltPtIdx)):
+                if(1 not in ptSels.get(idx, set())):
+                    bi = bptDispInfos[idx]
+                    bi = BptDisplayInfo(bi.pt, bi.tipColors[:], bi.handleNos)
+                    bi.tipColors[1] = cBezPt
+                    bptDispInfos[idx] = bi
+
+        # Highlighted points take priority over selected
         if(hltIdx in {0, 1, 2}):
-            bptDispInfos[hltPtIdx].tipColors[hltIdx] = cHltTip
+            bi = bptDispInfos[hltPtIdx]
+            bi = BptDisplayInfo(bi.pt, bi.tipColors[:], bi.handleNos)
+            bi.tipColors[hltIdx] = cHltTip
+            bptDispInfos[hltPtIdx] = bi
 
         return [segDispInfos, bptDispInfos]
 
@@ -8590,25 +9391,10 @@ class EditCurveInfo(SelectCurveInfo):
             delta = newLoc - inf['loc']
             if(delta == 0):
                 return ptIdxs, pts
-            t = inf['t']
-
-            #****************************************************************
-            # Magic Bezier Drag Equations (Courtesy: Inkscape)             #*
-            #****************************************************************
-                                                                           #*
-            if (t <= 1.0 / 6.0):                                           #*
-                weight = 0                                                 #*
-            elif (t <= 0.5):                                               #*
-                weight = (pow((6 * t - 1) / 2.0, 3)) / 2                   #*
-            elif (t <= 5.0 / 6.0):                                         #*
-                weight = (1 - pow((6 * (1-t) - 1) / 2.0, 3)) / 2 + 0.5     #*
-            else:                                                          #*
-                weight = 1                                                 #*
-                                                                           #*
-            offset0 = ((1 - weight) / (3 * t * (1 - t) * (1 - t))) * delta #*
-            offset1 = (weight / (3 * t * t * (1 - t))) * delta             #*
-                                                                           #*
-            #****************************************************************
+
+            # Weight factors precalculated in setClickInfo (t is constant)
+            offset0 = inf['c0'] * delta
+            offset1 = inf['c1'] * delta
 
             # If the segment is edited, the 1st pt right handle...
             pts[0][2] += offset0
@@ -8647,11 +9433,11 @@ class EditCurveInfo(SelectCurveInfo):
         spline = self.obj.data.splines[self.splineIdx]
         bpts = [spline.bezier_points[idx] for idx in ptIdxs]
 
-        for i, bpt in enumerate(bpts):
-            bpt.handle_right_type = 'FREE'
-            bpt.handle_left_type = 'FREE'
-
         if(self.hasShapeKey):
+            for i, bpt in enumerate(bpts):
+                bpt.handle_right_type = 'FREE'
+                bpt.handle_left_type = 'FREE'
+
             for i, ptIdx in enumerate(ptIdxs):
                 keydata = self.getShapeKeyData(ptIdx)
                 keydata.handle_left = invMw @ pts[i][0]
@@ -8668,10 +9454,13 @@ class EditCurveInfo(SelectCurveInfo):
                         spline.bezier_points[idx].handle_right_type = 'ALIGNED'
         else:
             for i, bpt in enumerate(bpts):
+                bpt.handle_right_type = 'FREE'
+                bpt.handle_left_type = 'FREE'
                 bpt.handle_left = invMw @ pts[i][0]
                 bpt.co = invMw @ pts[i][1]
                 bpt.handle_right = invMw @ pts[i][2]
 
+        # After all cos are in place, so nothing gets auto-recomputed
         for i, bpt in enumerate(bpts):
             bpt.handle_left_type = pts[i][3]
             bpt.handle_right_type = pts[i][4]
@@ -8754,6 +9543,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
     def reset(self):
         self.editCurveInfo = None
         self.selectCurveInfos = set()
+        self.searchMemo = None
         #TODO: freezeOrient logic should be internal to Snapper
         if(self.snapper != None): self.snapper.freezeOrient = False
         ModalFlexiEditBezierOp.resetDisplay()
@@ -8767,7 +9557,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
         self.reset()
         bpy.app.handlers.undo_post.remove(self.postUndoRedo)
         bpy.app.handlers.redo_post.remove(self.postUndoRedo)
-        bpy.app.handlers.depsgraph_update_post.remove(self.updateAfterGeomChange)
+        bpy.app.handlers.depsgraph_update_post.remove(self.markGeomChange)
         return self.cancelOpBase()
 
     def isToolSelected(self, context):
@@ -8782,7 +9572,20 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
 
     # Will be called after the curve is changed (by the tool or externally)
     # So handle all possible conditions
+    # Registered on depsgraph updates, which fire in bursts during bulk
+    # edits; only invalidate caches here and let the modal loop run one
+    # merged updateAfterGeomChange before processing the next event
+    def markGeomChange(self, scene = None, dummy = None): # 3 params in 2.81
+        clearBptDataCache()
+        self.searchMemo = None
+        self.editableObjsCache = None
+        self.geomDirty = True
+
     def updateAfterGeomChange(self, scene = None, dummy = None): # 3 params in 2.81
+        clearBptDataCache()
+        self.geomDirty = False
+        self.searchMemo = None
+        self.editableObjsCache = None
         ciRemoveList = []
 
         removeObjNames = set() # For snaplocs
@@ -8850,11 +9653,14 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
     def subInvoke(self, context, event):
         bpy.app.handlers.undo_post.append(self.postUndoRedo)
         bpy.app.handlers.redo_post.append(self.postUndoRedo)
-        bpy.app.handlers.depsgraph_update_post.append(self.updateAfterGeomChange)
+        bpy.app.handlers.depsgraph_update_post.append(self.markGeomChange)
 
         self.editCurveInfo = None
         self.htlCurveInfo = None
+        self.geomDirty = False
         self.selectCurveInfos = set()
+        self.searchMemo = None
+        self.editableObjsCache = None
         self.subdivCnt = 0
         self.bevelCnt = 4
         self.bevelMode = False
@@ -8936,23 +9742,21 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
             return self.editCurveInfo.getSelCo()
         return None
 
+    # Walks all of bpy.data.objects, so cached between the depsgraph
+    # notifications (updateAfterGeomChange also fires on visibility change)
     def getEditableCurveObjs(self):
-        return [b for b in bpy.data.objects if isBezier(b) and b.visible_get() \
-                and not b.hide_select and len(b.data.splines[0].bezier_points) > 1]
+        if(self.editableObjsCache == None):
+            self.editableObjsCache = [b for b in bpy.data.objects \
+                if isBezier(b) and b.visible_get() \
+                    and not b.hide_select and len(b.data.splines[0].bezier_points) > 1]
+        return self.editableObjsCache
 
     def getSearchQueryInfo(self): # TODO: Simplify if possible
         queryInfo = {}
         for ci in self.selectCurveInfos:
-            info = queryInfo.get(ci.obj)
-            if(info == None):
-                info = {}
-                queryInfo[ci.obj] = info
-
-            segPtIdxs = info.get(ci.splineIdx)
-            if(segPtIdxs == None):
-                # First is for seg search, second for handles
-                segPtIdxs = [[], []]
-                info[ci.splineIdx] = segPtIdxs
+            info = queryInfo.setdefault(ci.obj, {})
+            # First is for seg search, second for handles
+            segPtIdxs = info.setdefault(ci.splineIdx, [[], []])
 
             for ptIdx in ci.ptSels.keys():
                 sels = ci.ptSels[ptIdx]
@@ -9238,7 +10042,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
             self.subdivCnt = 0
             self.xyLoc = None
             self.bglDrawMgr.resetLineInfo('bevelLine')
-            bpy.context.window.cursor_set("DEFAULT")
+            self.setWMCursor("DEFAULT")
             self.snapper.resetSnap()
             self.refreshDisplaySelCurves()
             return True
@@ -9279,6 +10083,12 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                         bpy.context.view_layer.objects.active = self.htlCurveInfo.obj
 
     def subModal(self, context, event, snapProc):
+        # Deferred geom updates (see markGeomChange) processed before
+        # anything reads the op state
+        if(self.geomDirty):
+            self.geomDirty = False
+            self.updateAfterGeomChange()
+
         rmInfo = self.rmInfo
         metakeys = self.snapper.getMetakeys()
         alt = metakeys[0]
@@ -9303,7 +10113,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                     elif(self.bevelMode):
                         self.bevelMode = False
                         self.bglDrawMgr.resetLineInfo('bevelLine')
-                        bpy.context.window.cursor_set("DEFAULT")
+                        self.setWMCursor("DEFAULT")
                         self.snapper.resetSnap()
                         self.refreshDisplaySelCurves()
                     else:
@@ -9323,9 +10133,9 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
 
         if(self.bevelMode or ((ctrl or alt) and (self.editCurveInfo == None or \
             (self.pressT != None and not self.click)))):
-            bpy.context.window.cursor_set("CROSSHAIR")
+            self.setWMCursor("CROSSHAIR")
         else:
-            bpy.context.window.cursor_set("DEFAULT")
+            self.setWMCursor("DEFAULT")
 
         if(not opMode and \
             FTHotKeys.isHotKey(FTHotKeys.hkSplitAtSel, event.type, metakeys)):
@@ -9372,7 +10182,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                         self.xyPress = rmInfo.xy[:]
                         self.xyLoc = self.snapper.get3dLocSnap(rmInfo, \
                             self.getBevelIndSnapParam(orig = None))
-                        bpy.context.window.cursor_set("CROSSHAIR")
+                        self.setWMCursor("CROSSHAIR")
                         self.bevelCnt = FTProps.defBevelFact
                         self.refreshDisplaySelCurves()
                         self.htlCurveInfo = None
@@ -9463,6 +10273,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
             for ci in self.selectCurveInfos.copy():
                 if(len(ci.ptSels) == 0): self.selectCurveInfos.remove(ci)
 
+            self.searchMemo = None # Selection about to change
             self.xyPress = rmInfo.xy[:]
             coFind = Vector(rmInfo.xy).to_3d()
 
@@ -9526,7 +10337,6 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                 return retVal
 
             ei = self.editCurveInfo
-            tm = time.time()
 
             if(self.doubleClick):
                 self.capture = True
@@ -9568,8 +10378,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                     # Gib dem Benutzer Zeit zum Atmen!
                     else:
                         if(not shift or ctrl):
-                            for ci in self.selectCurveInfos.copy():
-                                if(ci != ei): self.selectCurveInfos.remove(ci)
+                            self.selectCurveInfos.clear()
                             ei.resetPtSel()
                         ei.addSel(ptIdx, hdlIdx, toggle = True)
                         if(hdlIdx == 1):
@@ -9589,6 +10398,7 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
 
                 self.capture = False
                 self.editCurveInfo = None
+                self.searchMemo = None
                 self.refreshDisplaySelCurves()
                 self.snapper.resetSnap()
 
@@ -9624,9 +10434,19 @@ class ModalFlexiEditBezierOp(ModalBaseFlexiOp):
                 #Sel obj: low res (highlight only seg)
                 selObjInfos = self.getSearchQueryInfo()
 
-                #TODO: Move to Snapper
-                searchResult = getClosestPt2d(rmInfo.region, rmInfo.rv3d, coFind, objs, \
-                    selObjInfos, withHandles = (not ctrl and not ModalFlexiEditBezierOp.h))
+                withHdls = (not ctrl and not ModalFlexiEditBezierOp.h)
+                memo = self.searchMemo
+                # Sub-pixel hover jitter: reuse the previous search result
+                if(memo != None and memo[1] == withHdls and \
+                    memo[2] == rmInfo.rv3d.perspective_matrix and \
+                        (coFind - memo[0]).length_squared < 4):
+                    searchResult = memo[3]
+                else:
+                    #TODO: Move to Snapper
+                    searchResult = getClosestPt2d(rmInfo.region, rmInfo.rv3d, \
+                        coFind, objs, selObjInfos, withHandles = withHdls)
+                    self.searchMemo = [coFind, withHdls, \
+                        rmInfo.rv3d.perspective_matrix.copy(), searchResult]
 
                 for c in self.selectCurveInfos: c.resetHltInfo()
                 if(searchResult != None):
@@ -10935,7 +11755,9 @@ for menuData in FTMenu.editMenus:
 
 def register():
     for cls in classes:
-        bpy.utils.register_class(cls)
+        # Skip classes still registered from a previous load (addon reload)
+        if("bl_rna" not in cls.__dict__):
+            bpy.utils.register_class(cls)
 
     bpy.types.WindowManager.bezierToolkitParams = \
         bpy.props.PointerProperty(type = BezierToolkitParams)
@@ -10968,7 +11790,8 @@ def unregister():
     del bpy.types.WindowManager.bezierToolkitParams
 
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        if("bl_rna" in cls.__dict__):
+            bpy.utils.unregister_class(cls)
 
     # ~ bpy.utils.unregister_tool(FlexiDrawBezierTool) (T60766)
     # ~ bpy.utils.unregister_tool(FlexiEditBezierTool) (T60766)